@@ -0,0 +1,209 @@
+import statistics
+import time
+from datagen import generate_batches_numpy
+from sampling import sample, run_query
+
+# Kandidati za indekse: vrsta, poizvedbe, ki jim lahko pomagajo, in SQL po narečjih.
+# Kandidat brez SQL za narečje (npr. delni indeks v MySQL) se za to bazo preskoči.
+CANDIDATES = [
+    {
+        "name": "idx_users_balance",
+        "kind": "btree",
+        "queries": ["Range poizvedba", "ORDER BY"],
+        "sql": {
+            "postgresql": "CREATE INDEX idx_users_balance ON users(balance)",
+            "mysql": "CREATE INDEX idx_users_balance ON users(balance)",
+        },
+    },
+    {
+        "name": "idx_users_balance_covering",
+        "kind": "covering",
+        "queries": ["Range poizvedba", "ORDER BY"],
+        "sql": {
+            "postgresql": "CREATE INDEX idx_users_balance_covering ON users(balance) "
+                          "INCLUDE (id, username, email, created_at, status)",
+            # InnoDB sekundarni indeks že vsebuje primarni ključ
+            "mysql": "CREATE INDEX idx_users_balance_covering ON users(balance, username, email, created_at, status)",
+        },
+    },
+    {
+        "name": "idx_users_balance_partial",
+        "kind": "partial",
+        "queries": ["Range poizvedba"],
+        "sql": {
+            "postgresql": "CREATE INDEX idx_users_balance_partial ON users(balance) WHERE balance BETWEEN 5000 AND 6000",
+        },
+    },
+    {
+        "name": "idx_users_status",
+        "kind": "btree",
+        "queries": ["COUNT", "AVG agregacija"],
+        "sql": {
+            "postgresql": "CREATE INDEX idx_users_status ON users(status)",
+            "mysql": "CREATE INDEX idx_users_status ON users(status)",
+        },
+    },
+    {
+        "name": "idx_users_status_balance",
+        "kind": "composite",
+        "queries": ["AVG agregacija", "COUNT"],
+        "sql": {
+            "postgresql": "CREATE INDEX idx_users_status_balance ON users(status, balance)",
+            "mysql": "CREATE INDEX idx_users_status_balance ON users(status, balance)",
+        },
+    },
+    {
+        "name": "idx_users_email_trgm",
+        "kind": "trigram",
+        "queries": ["LIKE iskanje"],
+        "requires": {"postgresql": ["CREATE EXTENSION IF NOT EXISTS pg_trgm"]},
+        "sql": {
+            "postgresql": "CREATE INDEX idx_users_email_trgm ON users USING gin (email gin_trgm_ops)",
+        },
+    },
+]
+
+# Časovni proračun vzorčenja ene poizvedbe pri oceni kandidata (sekunde)
+TIME_BUDGET = 2.0
+
+# Število vrstic in ponovitev za oceno cene vstavljanja
+WRITE_ROWS = 20000
+WRITE_REPEATS = 5
+
+# Najmanjša pospešitev, pri kateri kandidat pride v priporočeni nabor
+MIN_SPEEDUP = 1.2
+
+def insert_cost(engine, conn, rows=WRITE_ROWS, repeats=WRITE_REPEATS):
+    """Mediana časa vstavljanja rows vrstic v sekundah
+
+    Prva ponovitev je ogrevalna. Vstavljene vrstice se po vsaki ponovitvi
+    izbrišejo, na koncu pa se tabela počisti, da ne upočasni poizvedb.
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT MAX(id) FROM users")
+    max_id = cursor.fetchone()[0] or 0
+    conn.commit()
+    times = []
+    for i in range(repeats + 1):
+        start = time.perf_counter()
+        engine.load(conn, generate_batches_numpy(rows, seed=i))
+        times.append(time.perf_counter() - start)
+        cursor.execute(f"DELETE FROM users WHERE id > {max_id}")
+        conn.commit()
+    cursor.close()
+    engine.vacuum(conn)
+    return statistics.median(times[1:])
+
+def measure(conn, query, time_budget=TIME_BUDGET):
+    """Povprečni čas poizvedbe v nanosekundah"""
+    return sample(lambda: run_query(conn, query), time_budget=time_budget)["mean"]
+
+def evaluate_candidate(engine, conn, candidate, queries, before, base_insert):
+    """Zgradi kandidata, izmeri učinek na poizvedbe in ceno vstavljanja, nato ga odstrani"""
+    cursor = conn.cursor()
+    for statement in candidate.get("requires", {}).get(engine.dialect, []):
+        cursor.execute(statement)
+    start = time.perf_counter()
+    cursor.execute(candidate["sql"][engine.dialect])
+    conn.commit()
+    build = time.perf_counter() - start
+    cursor.close()
+
+    result = {
+        "candidate": candidate,
+        "sql": candidate["sql"][engine.dialect],
+        "build": build,
+        "queries": {},
+    }
+    try:
+        engine.optimize(conn)
+        result["size"] = engine.index_bytes(conn, candidate["name"])
+        for query_name in candidate["queries"]:
+            query = queries[query_name]
+            plan = engine.explain(conn, query)
+            after = measure(conn, query)
+            result["queries"][query_name] = {
+                "before": before[query_name],
+                "after": after,
+                "speedup": before[query_name] / after,
+                "used": candidate["name"] in plan["indexes"],
+            }
+        result["insert_overhead"] = (insert_cost(engine, conn) - base_insert) / base_insert * 100
+    finally:
+        # Po napaki je transakcija pri PostgreSQL prekinjena in DROP INDEX bi prikril izvorno napako
+        conn.rollback()
+        engine.drop_index(conn, candidate["name"])
+    return result
+
+def recommend(results, min_speedup=MIN_SPEEDUP):
+    """Izbere nabor indeksov: najprej tisti z največ prihranjenega časa
+
+    Kandidat pride v nabor le, če vsaj eno še nepokrito poizvedbo pospeši za
+    min_speedup in jo planer dejansko uporabi.
+    """
+    def saved(result):
+        return sum(q["before"] - q["after"] for q in result["queries"].values() if q["used"])
+
+    chosen = []
+    covered = set()
+    for result in sorted(results, key=saved, reverse=True):
+        helps = {name for name, q in result["queries"].items() if q["used"] and q["speedup"] >= min_speedup}
+        if helps - covered:
+            chosen.append(result)
+            covered |= helps
+    return chosen
+
+def advise(engine, conn, queries, candidates=CANDIDATES):
+    """Predlaga indekse za poizvedbe na enem cilju
+
+    Za vsako poizvedbo zbere plan; kandidati se preizkusijo le za poizvedbe,
+    ki berejo celo tabelo ali sortirajo. Vrne ocenjene kandidate in priporočeni nabor.
+    """
+    plans = {name: engine.explain(conn, query) for name, query in queries.items()}
+    for name, plan in plans.items():
+        access = "celotna tabela" if plan["full_scan"] else ", ".join(plan["indexes"]) or "-"
+        details = f" | {plan['time_ms']:.3f}ms, {plan['buffers']} blokov" if plan["time_ms"] is not None else ""
+        print(f"  {name:18} | {access}{' + sort' if plan['sort'] else ''}{details}")
+
+    existing = set(engine.indexes(conn))
+    slow = {name for name, plan in plans.items() if plan["full_scan"] or plan["sort"]}
+    todo = [
+        c for c in candidates
+        if engine.dialect in c["sql"] and c["name"] not in existing and slow & set(c["queries"])
+    ]
+    if not todo:
+        print("  Ni kandidatov za preizkus")
+        return [], []
+
+    base_insert = insert_cost(engine, conn)
+    before = {name: measure(conn, queries[name]) for name in {q for c in todo for q in c["queries"]}}
+    results = []
+    for candidate in todo:
+        try:
+            results.append(evaluate_candidate(engine, conn, candidate, queries, before, base_insert))
+        except Exception as e:
+            conn.rollback()
+            print(f"  ✗ {candidate['name']}: {e}")
+    return results, recommend(results)
+
+def print_advice(name, results, chosen):
+    """Izpiše oceno kandidatov in priporočeni nabor"""
+    print(f"\n{name}:")
+    print(f"{'Kandidat':28} | {'Vrsta':9} | {'Poizvedba':16} | {'Pred':>9} | {'Po':>9} | "
+          f"{'Pospešitev':>13} | {'Gradnja':>8} | {'Velikost':>9} | INSERT")
+    print("-" * 130)
+    for result in results:
+        candidate = result["candidate"]
+        size = f"{result['size']/1024/1024:.2f} MB" if result["size"] is not None else "-"
+        for query_name, q in result["queries"].items():
+            speedup = f"{q['speedup']:.2f}x" if q["used"] else "ni uporabljen"
+            print(f"{candidate['name']:28} | {candidate['kind']:9} | {query_name:16} | "
+                  f"{q['before']/1e6:7.3f}ms | {q['after']/1e6:7.3f}ms | {speedup:>13} | "
+                  f"{result['build']:7.3f}s | {size:>9} | {result['insert_overhead']:+.1f}%")
+    if not chosen:
+        print(f"\n{name}: noben kandidat ne prinese pospešitve {MIN_SPEEDUP}x")
+        return
+    overhead = sum(result["insert_overhead"] for result in chosen)
+    print(f"\n{name} priporočeni indeksi (dodatna cena INSERT ~{overhead:+.1f}%):")
+    for result in chosen:
+        print(f"  {result['sql']};")
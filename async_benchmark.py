@@ -0,0 +1,118 @@
+import argparse
+import asyncio
+import asyncpg
+import aiomysql
+from bench import QUERIES, TARGETS
+from connections import MYSQL_CONFIG, PG_CONFIG
+from latency import LatencyHistogram, now_ns
+from loadgen import DURATION, print_load_result, summarize
+
+# Število sočasnih poizvedb v letu
+CONCURRENCY_LEVELS = [1, 10, 100, 1000]
+
+# Največje število povezav v bazenu
+POOL_SIZE = 50
+
+async def create_pool_postgresql(engine, size=POOL_SIZE):
+    """Ustvari asinhroni bazen povezav s PostgreSQL na gostitelju in vratih cilja"""
+    return await asyncpg.create_pool(host=engine.host, port=engine.port, min_size=size, max_size=size, **PG_CONFIG)
+
+async def create_pool_mysql(engine, size=POOL_SIZE):
+    """Ustvari asinhroni bazen povezav z MySQL/MariaDB na gostitelju in vratih cilja"""
+    return await aiomysql.create_pool(
+        host=engine.host, port=engine.port, db=MYSQL_CONFIG["database"],
+        user=MYSQL_CONFIG["user"], password=MYSQL_CONFIG["password"],
+        minsize=size, maxsize=size, autocommit=True
+    )
+
+async def execute_postgresql(pool, query):
+    """Izvede poizvedbo na povezavi iz bazena PostgreSQL"""
+    async with pool.acquire() as conn:
+        await conn.fetch(query)
+
+async def execute_mysql(pool, query):
+    """Izvede poizvedbo na povezavi iz bazena MySQL/MariaDB"""
+    async with pool.acquire() as conn:
+        async with conn.cursor() as cursor:
+            await cursor.execute(query)
+            await cursor.fetchall()
+
+async def _client(pool, execute, query, deadline, histogram, errors):
+    """En asinhroni klient: ponavlja poizvedbo do roka"""
+    while now_ns() < deadline:
+        start = now_ns()
+        try:
+            await execute(pool, query)
+            histogram.record(now_ns() - start)
+        except Exception:
+            errors.append(1)
+
+async def run_async_load(pool, execute, query, concurrency, duration=DURATION):
+    """Izvaja poizvedbo s concurrency sočasnimi poizvedbami v letu
+
+    Poizvedbe, ki čakajo na prosto povezavo, so vključene v latenco,
+    tako kot pri odjemalcu z bazenom povezav v produkciji. Vse naloge
+    tečejo v eni niti, zato si delijo en histogram.
+    """
+    histogram = LatencyHistogram()
+    errors = []
+    start = now_ns()
+    deadline = start + int(duration * 1e9)
+    await asyncio.gather(*[
+        _client(pool, execute, query, deadline, histogram, errors)
+        for _ in range(concurrency)
+    ])
+    elapsed = (now_ns() - start) / 1e9
+    return summarize(histogram, concurrency, len(errors), elapsed)
+
+# Asinhroni gonilnik po narečju cilja: ustvarjanje bazena in izvajanje poizvedbe
+DRIVERS = {
+    "postgresql": (create_pool_postgresql, execute_postgresql),
+    "mysql": (create_pool_mysql, execute_mysql),
+}
+
+async def close_pool(pool):
+    # aiomysql zapre bazen s close in počaka z wait_closed, pri asyncpg je close korutina
+    if hasattr(pool, "wait_closed"):
+        pool.close()
+        await pool.wait_closed()
+    else:
+        await pool.close()
+
+async def run_async_benchmarks(targets=TARGETS, concurrency_levels=CONCURRENCY_LEVELS, duration=DURATION,
+                               pool_size=POOL_SIZE):
+    """Asinhroni obremenitveni test za vse cilje; gostitelj in vrata so vzeta iz ciljev"""
+    pools = {}
+    for engine in targets:
+        create_pool, _ = DRIVERS[engine.dialect]
+        pools[engine.name] = await create_pool(engine, pool_size)
+
+    print("\n" + "="*80)
+    print(f"ASINHRONI BENCHMARK - bazen {pool_size} povezav - {' vs '.join(engine.name for engine in targets)}")
+    print("="*80)
+
+    try:
+        for query_name, query in QUERIES.items():
+            print(f"\n{query_name}:")
+            print("-" * 80)
+            for engine in targets:
+                _, execute = DRIVERS[engine.dialect]
+                for concurrency in concurrency_levels:
+                    result = await run_async_load(pools[engine.name], execute, query, concurrency, duration)
+                    print_load_result(engine.name, result)
+    finally:
+        for pool in pools.values():
+            await close_pool(pool)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Asinhroni benchmark ciljev iz bench.TARGETS")
+    parser.add_argument("--only", action="append", help="omeji izvajanje na cilj s tem imenom (lahko večkrat)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=CONCURRENCY_LEVELS, help="število sočasnih poizvedb")
+    parser.add_argument("--duration", type=float, default=DURATION, help="trajanje merjenja v sekundah")
+    parser.add_argument("--pool-size", type=int, default=POOL_SIZE, help="velikost bazena povezav")
+    args = parser.parse_args()
+    targets = [engine for engine in TARGETS if not args.only or engine.name in args.only]
+    if not targets:
+        parser.error("ni izbranih ciljev")
+
+    asyncio.run(run_async_benchmarks(targets, args.concurrency, args.duration, args.pool_size))
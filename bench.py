@@ -0,0 +1,574 @@
+import argparse
+import sys
+import time
+from advisor import advise, print_advice
+from datagen import ORDER_SKEW, ORDERS_PER_USER, generate_batches_numpy, peak_rss_mb
+from engines import INDEXES, MySQLEngine, PostgreSQLEngine
+from loaders import print_load_results, sweep_batch_sizes
+from index_build import compare_parallel, print_parallel, print_sweep, sweep_settings
+from loadgen import CLIENT_COUNTS, DURATION, load_curve
+from netem import RTTS, SWEEP_RECORDS, print_rtt_sweep, sweep_rtt
+from oltp import CLIENTS as OLTP_CLIENTS, WRITE_RATIO, print_oltp, run_oltp
+from orders import STATES, benchmark_orders, print_orders
+from online_index import BACKGROUND_CLIENTS, compare_build_modes, print_build_results
+from phases import FETCH_SIZE, decode_time, print_phases, profile_modes
+from pipeline import QUERY_DEPTH, compare_pipeline, measure_rtt, print_pipeline
+from pool import POOL_CLIENTS, POOL_SIZES, connect_cost, print_connect_cost, print_pool_result, sweep_pool_sizes
+from plans import capture_plan, find_plan_changes, print_plan_changes
+from regression import BASELINE, THRESHOLD, compare, load_baseline, print_comparison
+from results import RESULTS_DB, describe, open_store, record_histograms, record_load_curves, record_samples, record_values, start_run
+from sampling import ALPHA, format_result, mann_whitney_p, run_query, sample
+from workload import DEFAULT_WORKLOAD, load_workload, print_workload_result, run_workload
+
+# Število zapisov za test
+NUM_RECORDS = 100000
+
+# Privzeti cilji; vsak cilj je ena baza na enem gostitelju
+TARGETS = [
+    PostgreSQLEngine("PostgreSQL"),
+    MySQLEngine("MySQL"),
+    # MySQLEngine("MariaDB", port=3307),
+    # PostgreSQLEngine("FreeBSD", host="192.168.0.12"),
+]
+
+QUERIES = {
+    "Simple SELECT": "SELECT * FROM users WHERE id = 5000",
+    "COUNT": "SELECT COUNT(*) FROM users",
+    "AVG agregacija": "SELECT status, AVG(balance) FROM users GROUP BY status",
+    "LIKE iskanje": "SELECT * FROM users WHERE email LIKE '%500%'",
+    "Range poizvedba": "SELECT * FROM users WHERE balance BETWEEN 5000 AND 6000",
+    "ORDER BY": "SELECT * FROM users ORDER BY balance DESC LIMIT 100",
+}
+
+COMMANDS = ["setup", "benchmark", "optimize", "sizes", "load", "phases", "workload", "prepared", "check", "advise", "online-index", "index-build", "pipeline", "netem", "orders", "oltp", "pool"]
+
+def _width(targets):
+    return max([12] + [len(engine.name) for engine in targets])
+
+def _title(text, targets):
+    print("\n" + "="*80)
+    print(f"{text} - {' vs '.join(engine.name for engine in targets)}")
+    print("="*80)
+
+def connect_all(targets, pool_size):
+    """Odpre bazen povezav na cilj in iz njega vzame glavno povezavo za vse ukaze
+
+    Klienti obremenitvenih testov, oltp in gradnje indeksov povezave jemljejo
+    iz istega bazena, zato se med ukazi ponovno uporabijo.
+    """
+    print("Povezovanje z bazami...")
+    conns = {engine.name: engine.open_pool(pool_size).acquire() for engine in targets}
+    print("✓ Povezava uspešna")
+    return conns
+
+def close_all(targets, conns):
+    for engine in targets:
+        engine.pool.release(conns[engine.name])
+        engine.close_pool()
+
+def load_all(targets, conns, make_batches, num_records):
+    """Naloži iste pakete v vse cilje v enem prehodu generatorja
+
+    Podatki se generirajo le enkrat, čas pa se meri ločeno za vsak cilj.
+    """
+    elapsed = {engine.name: 0.0 for engine in targets}
+    for batch in make_batches():
+        for engine in targets:
+            start = time.perf_counter()
+            engine.load(conns[engine.name], [batch])
+            elapsed[engine.name] += time.perf_counter() - start
+    for engine in targets:
+        seconds = elapsed[engine.name]
+        print(f"✓ {engine.name} INSERT ({engine.default_load_method}): {seconds:.2f}s ({num_records/seconds:.0f} records/s)")
+    return elapsed
+
+def run_setup(targets, conns, num_records=NUM_RECORDS, compare_methods=False, sweep_batches=False):
+    """Ustvari tabele in naloži testne podatke v vse cilje
+
+    Vrne čase nalaganja v sekundah po ciljih in metodah.
+    """
+    _title("SETUP TESTNIH PODATKOV", targets)
+
+    def make_batches():
+        return generate_batches_numpy(num_records)
+
+    print("\nUstvarjam tabele...")
+    for engine in targets:
+        engine.create_tables(conns[engine.name])
+        print(f"  ✓ {engine.name} tabele ustvarjene")
+
+    print(f"\nVstavljam {num_records} testnih zapisov...")
+    loads = {engine.name: {} for engine in targets}
+    if not compare_methods and not sweep_batches:
+        elapsed = load_all(targets, conns, make_batches, num_records)
+        for engine in targets:
+            loads[engine.name][engine.default_load_method] = elapsed[engine.name]
+    else:
+        for engine in targets:
+            conn = conns[engine.name]
+            if sweep_batches and engine.dialect == "mysql":
+                print()
+                sweep = sweep_batch_sizes(conn, make_batches, engine.name)
+                trips = {size: engine.load_round_trips("multirow", num_records, batch_size=size) for size in sweep}
+                print_load_results(sweep, num_records, header="Paket", round_trips=trips)
+                loads[engine.name].update({f"multirow/{size}": seconds for size, seconds in sweep.items()})
+                engine.truncate(conn)
+            if compare_methods:
+                print()
+                methods = engine.compare_load_methods(conn, make_batches)
+                trips = {method: engine.load_round_trips(method, num_records) for method in methods}
+                print_load_results(methods, num_records, round_trips=trips)
+                loads[engine.name].update(methods)
+            else:
+                engine.load(conn, make_batches())
+
+    print(f"\nNajvečja poraba pomnilnika (RSS): {peak_rss_mb():.1f} MB")
+    return loads
+
+def print_verdict(results, width):
+    """Primerja najhitrejši cilj z ostalimi s testom značilnosti"""
+    ranked = sorted(results.items(), key=lambda item: item[1]["mean"])
+    faster, best = ranked[0]
+    for name, result in ranked[1:]:
+        p_value = mann_whitney_p(best["samples"], result["samples"])
+        if p_value >= ALPHA:
+            print(f"{'':{width}} | {faster} vs {name}: razlika ni statistično značilna (p={p_value:.3f})")
+            continue
+        diff_percent = ((result["mean"] - best["mean"]) / result["mean"] * 100)
+        print(f"{'':{width}} | {faster} je hitrejši od {name} za {diff_percent:.1f}% (p={p_value:.4f})")
+
+def run_benchmark(targets, conns, queries=QUERIES):
+    """Izmeri vse poizvedbe na vseh ciljih; vrne rezultate po poizvedbah in ciljih
+
+    Ob vsaki meritvi se zajame tudi plan poizvedbe.
+    """
+    _title("BENCHMARK REZULTATI", targets)
+    width = _width(targets)
+    all_results = {}
+
+    for query_name, query in queries.items():
+        print(f"\n{query_name}:")
+        print("-" * 80)
+        results = {}
+        for engine in targets:
+            conn = conns[engine.name]
+            results[engine.name] = sample(lambda: run_query(conn, query))
+            results[engine.name]["plan"] = capture_plan(engine, conn, query)
+            print(format_result(engine.name, results[engine.name], width))
+            print(f"{'':{width}} | Plan: {results[engine.name]['plan']['shape']}")
+        if len(results) > 1:
+            print_verdict(results, width)
+        all_results[query_name] = results
+    return all_results
+
+def print_prepared_delta(name, adhoc, prepared, width):
+    """Izpiše razliko med ad-hoc in pripravljenim izvajanjem"""
+    delta = prepared["mean"] - adhoc["mean"]
+    p_value = mann_whitney_p(adhoc["samples"], prepared["samples"])
+    verdict = "značilno" if p_value < ALPHA else "ni značilno"
+    print(f"{'':{width}} | {name}: pripravljen stavek {delta/1e6:+.3f}ms "
+          f"({delta / adhoc['mean'] * 100:+.1f}%, {verdict}, p={p_value:.4f})")
+
+def run_prepared(targets, conns, queries=QUERIES):
+    """Primerja ad-hoc SQL z vnaprej pripravljenimi stavki
+
+    Ad-hoc poizvedba se ob vsaki izvedbi razčleni in planira, pripravljen
+    stavek (PREPARE/EXECUTE oziroma binarni protokol) pa le izvede, zato
+    razlika pokaže ceno razčlenjevanja in planiranja.
+    """
+    _title("PRIPRAVLJENI STAVKI vs AD-HOC SQL", targets)
+    width = _width(targets) + 9
+    all_results = {}
+
+    for query_name, query in queries.items():
+        print(f"\n{query_name}:")
+        print("-" * 80)
+        results = {}
+        for engine in targets:
+            conn = conns[engine.name]
+            adhoc = sample(lambda: run_query(conn, query))
+            statement = engine.prepare(conn, "bench_prepared", query)
+            prepared = sample(lambda: statement.execute({}))
+            statement.close()
+            conn.commit()
+            print(format_result(f"{engine.name} ad-hoc", adhoc, width))
+            print(format_result(f"{engine.name} prep", prepared, width))
+            print_prepared_delta(engine.name, adhoc, prepared, width)
+            results[engine.name] = {"adhoc": adhoc, "prepared": prepared}
+        all_results[query_name] = results
+    return all_results
+
+def run_pipeline(targets, conns, depth=QUERY_DEPTH, queries=QUERIES):
+    """Primerja zaporedno izvajanje poizvedb z izvajanjem v paketih
+
+    Pri oddaljenih ciljih zaporedna zanka meri predvsem krog do strežnika,
+    paket pa predvsem strežnik. Vrne čase kroga po ciljih in rezultate na
+    eno poizvedbo po poizvedbah in ciljih.
+    """
+    _title(f"PAKETNO IZVAJANJE - {depth} poizvedb na krog", targets)
+    width = _width(targets)
+    rtt = {}
+    for engine in targets:
+        rtt[engine.name] = measure_rtt(conns[engine.name])
+        print(f"{engine.name:{width}} | RTT (SELECT 1): {rtt[engine.name]/1e6:.3f}ms")
+
+    all_results = {}
+    for query_name, query in queries.items():
+        print(f"\n{query_name}:")
+        print("-" * 80)
+        results = {}
+        for engine in targets:
+            results[engine.name] = compare_pipeline(engine, conns[engine.name], query, depth)
+            print_pipeline(engine.name, results[engine.name], rtt[engine.name], width)
+        all_results[query_name] = results
+    return rtt, all_results
+
+def run_netem(targets, conns, rtts=RTTS, jitter_ms=0.0, bandwidth_mbit=None, records=SWEEP_RECORDS,
+              depth=QUERY_DEPTH, queries=QUERIES):
+    """Ponovi nalaganje in poizvedbe skozi lokalnega posrednika pri različnih RTT
+
+    Vrne ({cilj: {metoda/rtt: s}}, {cilj: {poizvedba/način/rtt: ns}}).
+    """
+    _title(f"EMULACIJA OMREŽJA - RTT {', '.join(f'{rtt:g}' for rtt in rtts)} ms", targets)
+    loads = {}
+    query_times = {}
+    for engine in targets:
+        print(f"\n{engine.name}:")
+        by_method, by_query = sweep_rtt(engine, queries, rtts, jitter_ms, bandwidth_mbit, records, depth)
+        print_rtt_sweep(engine.name, by_method, by_query, rtts, records)
+        engine.vacuum(conns[engine.name])
+        loads[engine.name] = {f"{method}/{rtt:g}ms": t for method, by_rtt in by_method.items() for rtt, t in by_rtt.items()}
+        query_times[engine.name] = {f"{label}/{rtt:g}ms": t for label, by_rtt in by_query.items() for rtt, t in by_rtt.items()}
+    return loads, query_times
+
+def run_orders(targets, conns, orders_per_user=ORDERS_PER_USER, skew=ORDER_SKEW):
+    """Naloži naročila in izmeri poizvedbe JOIN z in brez tujega ključa in indeksov
+
+    Vrne rezultate po ciljih; tabela orders na koncu ostane s tujim ključem in indeksi.
+    """
+    _title(f"NAROČILA - {orders_per_user} na uporabnika, Zipf s={skew}", targets)
+    results = {}
+    for engine in targets:
+        results[engine.name] = benchmark_orders(engine, conns[engine.name], orders_per_user, skew)
+        print_orders(engine.name, results[engine.name])
+    return results
+
+def run_oltp_scenarios(targets, conns, write_ratios=(WRITE_RATIO,), levels=None, clients=OLTP_CLIENTS,
+                       duration=DURATION):
+    """Mešane transakcije nad users in orders za vse deleže pisanj in stopnje izolacije
+
+    levels=None izbere vse stopnje, ki jih cilj podpira. Vrne rezultate po ciljih.
+    """
+    _title(f"TRANSAKCIJE (OLTP) - klientov: {clients}", targets)
+    width = _width(targets)
+    results = {}
+    for engine in targets:
+        conn = conns[engine.name]
+        results[engine.name] = []
+        for write_ratio in write_ratios:
+            for level in levels or engine.isolation_levels:
+                if level not in engine.isolation_levels:
+                    print(f"{engine.name:{width}} | {level}: ni podprta")
+                    continue
+                result = run_oltp(engine, conn, level, write_ratio, clients, duration)
+                print_oltp(engine.name, result, width)
+                results[engine.name].append(result)
+        engine.vacuum(conn)
+    return results
+
+def run_pool_sweep(targets, query_name="Simple SELECT", sizes=POOL_SIZES, clients=POOL_CLIENTS, duration=DURATION,
+                   queries=QUERIES):
+    """Cena nove povezave ter prepustnost in čakanje pri različnih velikostih bazena
+
+    Vsaka zahteva si povezavo izposodi in jo takoj vrne; vrstica »brez« za
+    vsako zahtevo odpre novo povezavo. Vrne cene povezav in rezultate po ciljih.
+    """
+    query = queries[query_name]
+    _title(f"BAZEN POVEZAV - {query_name}, klientov: {clients}", targets)
+    width = _width(targets)
+    costs, results = {}, {}
+    for engine in targets:
+        costs[engine.name] = connect_cost(engine, query)
+        print_connect_cost(engine.name, costs[engine.name], width)
+    for engine in targets:
+        print()
+        results[engine.name] = sweep_pool_sizes(engine, query, sizes, clients, duration)
+        for result in results[engine.name]:
+            print_pool_result(engine.name, result, width)
+    return costs, results
+
+def run_optimize(targets, conns, indexes=INDEXES):
+    """Doda indekse in posodobi statistiko na vseh ciljih"""
+    _title("OPTIMIZACIJA BAZ PODATKOV", targets)
+    for engine in targets:
+        conn = conns[engine.name]
+        cursor = conn.cursor()
+        print(f"\n{engine.name} optimizacija...")
+        for idx_name, idx_sql in indexes:
+            try:
+                start = time.perf_counter()
+                cursor.execute(idx_sql)
+                conn.commit()
+                elapsed = time.perf_counter() - start
+                print(f"  ✓ {idx_name}: {elapsed:.3f}s")
+            except Exception as e:
+                conn.rollback()
+                print(f"  ✗ {idx_name}: {e}")
+        cursor.close()
+        print(f"  ✓ {engine.optimize(conn)} completed")
+
+def run_advisor(targets, conns, queries=QUERIES):
+    """Predlaga indekse na podlagi planov in meritev kandidatov"""
+    _title("SVETOVALEC ZA INDEKSE", targets)
+    for engine in targets:
+        conn = conns[engine.name]
+        print(f"\n{engine.name} plani:")
+        results, chosen = advise(engine, conn, queries)
+        if results:
+            print_advice(engine.name, results, chosen)
+
+def run_online_index(targets, conns, indexes=INDEXES, clients=BACKGROUND_CLIENTS):
+    """Gradnja indeksov z in brez zaklepanja med ozadnjo obremenitvijo
+
+    Vrne čase gradnje po ciljih; indeksi na koncu ostanejo (zgrajeni online).
+    """
+    _title(f"GRADNJA INDEKSOV MED OBREMENITVIJO - klientov: {clients}", targets)
+    builds = {}
+    for engine in targets:
+        conn = conns[engine.name]
+        results = compare_build_modes(engine, conn, indexes, engine.index_build_modes, clients)
+        print_build_results(engine.name, results)
+        engine.optimize(conn)
+        builds[engine.name] = {f"{idx_name}/{r['mode']}": r["build"] for idx_name, modes in results.items() for r in modes}
+    return builds
+
+def run_index_build(targets, conns, indexes=INDEXES, sweep=True):
+    """Primerja zaporedno in vzporedno gradnjo indeksov ter preizkusi nastavitve gradnje
+
+    Vrne čase gradnje po ciljih; indeksi na koncu ostanejo.
+    """
+    _title("GRADNJA INDEKSOV - vzporednost in nastavitve", targets)
+    builds = {}
+    for engine in targets:
+        conn = conns[engine.name]
+        parallel = compare_parallel(engine, conn, indexes)
+        print_parallel(engine.name, parallel)
+        builds[engine.name] = dict(parallel)
+        for name, value in engine.static_settings(conn).items():
+            print(f"{'':12} | {name} = {value} (spremeni se le ob ponovnem zagonu strežnika)")
+        if sweep:
+            results = sweep_settings(engine, conn, indexes)
+            print_sweep(engine.name, results, indexes)
+            for settings, _, total in results:
+                builds[engine.name][", ".join(f"{k}={v}" for k, v in settings.items())] = total
+        engine.optimize(conn)
+    return builds
+
+def run_sizes(targets, conns):
+    """Prikaže velikosti tabel na vseh ciljih; vrne velikosti v bajtih"""
+    _title("VELIKOSTI TABEL", targets)
+    sizes = {}
+    for engine in targets:
+        conn = conns[engine.name]
+        print(f"\n{engine.name}:")
+        for table, size in engine.table_sizes(conn):
+            print(f"  {table}: {size}")
+        sizes[engine.name] = dict(engine.table_bytes(conn))
+    return sizes
+
+def run_load_test(targets, client_counts=CLIENT_COUNTS, duration=DURATION, requests=None, queries=QUERIES):
+    """Obremenitveni test: vsaka poizvedba iz več sočasnih klientov
+
+    Vrne krivulje skaliranja po poizvedbah in ciljih.
+    """
+    _title("OBREMENITVENI TEST - sočasni klienti", targets)
+    curves = {}
+    for query_name, query in queries.items():
+        print(f"\n{query_name}:")
+        print("-" * 80)
+        curves[query_name] = {
+            engine.name: load_curve(engine.connection, query, engine.name, client_counts, duration, requests)
+            for engine in targets
+        }
+    return curves
+
+def run_phase_breakdown(targets, conns, fetch_size=FETCH_SIZE, queries=QUERIES):
+    """Razčleni čas poizvedb na izvedbo, prvo vrstico, branje in dekodiranje"""
+    _title(f"FAZE POIZVEDB - pretočno branje po {fetch_size} vrstic", targets)
+    width = _width(targets)
+    for query_name, query in queries.items():
+        print(f"\n{query_name}:")
+        print("-" * 80)
+        decode = []
+        for engine in targets:
+            conn = conns[engine.name]
+            results = profile_modes(conn, engine.read_modes(conn, fetch_size), query)
+            print_phases(engine.name, results)
+            decode.append(f"{engine.name} {decode_time(results)/1e6:.3f}ms")
+        print(f"{'':{width}} | Dekodiranje vrstic: {', '.join(decode)}")
+
+def run_workload_file(targets, conns, path=DEFAULT_WORKLOAD, duration=None):
+    """Izvede obremenitev iz datoteke na vseh ciljih z enakim zaporedjem parametrov"""
+    workload = load_workload(path)
+    _title(f"OBREMENITEV {workload.get('name', path)}", targets)
+    width = _width(targets)
+    results = {}
+    for engine in targets:
+        results[engine.name] = run_workload(engine, conns[engine.name], workload, duration)
+        print_workload_result(engine.name, results[engine.name], width)
+    return results
+
+def main(targets=TARGETS, commands=("setup", "benchmark"), options=()):
+    """Zažene izbrane ukaze na seznamu ciljev
+
+    Če v ukazni vrstici ni ukazov, se izvedejo commands. options so privzete
+    zastavice, zato lahko skripte za posamezne pare baz ostanejo kratke.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark poljubnega števila baz in gostiteljev")
+    parser.add_argument("commands", nargs="*", help=f"ukazi, ki se izvedejo po vrsti: {', '.join(COMMANDS)}")
+    parser.add_argument("--only", action="append", help="omeji izvajanje na cilj s tem imenom (lahko večkrat)")
+    parser.add_argument("--records", type=int, default=NUM_RECORDS, help="število testnih zapisov")
+    parser.add_argument("--compare-methods", action="store_true", help="primerjaj vse metode nalaganja")
+    parser.add_argument("--sweep-batches", action="store_true", help="izmeri velikosti paketov (MySQL/MariaDB)")
+    parser.add_argument("--clients", type=int, nargs="+", default=CLIENT_COUNTS, help="število sočasnih klientov")
+    parser.add_argument("--duration", type=float, default=DURATION, help="trajanje merjenja v sekundah")
+    parser.add_argument("--requests", type=int, help="število zahtev na klienta namesto trajanja")
+    parser.add_argument("--fetch-size", type=int, default=FETCH_SIZE, help="velikost paketa pri pretočnem branju")
+    parser.add_argument("--workload", default=DEFAULT_WORKLOAD, help="datoteka z opisom obremenitve (TOML ali YAML)")
+    parser.add_argument("--results", default=RESULTS_DB, help="baza SQLite, v katero se shranijo rezultati")
+    parser.add_argument("--no-store", action="store_true", help="ne shranjuj rezultatov")
+    parser.add_argument("--baseline", default=BASELINE, help="osnova za ukaz check (glej regression.py)")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="prag regresije v %% za ukaz check")
+    parser.add_argument("--background-clients", type=int, default=BACKGROUND_CLIENTS, help="klienti ozadnje obremenitve za online-index")
+    parser.add_argument("--no-sweep", action="store_true", help="index-build brez preizkusa nastavitev")
+    parser.add_argument("--pipeline-depth", type=int, default=QUERY_DEPTH, help="število poizvedb v enem krogu za ukaz pipeline")
+    parser.add_argument("--rtt", type=float, nargs="+", default=RTTS, help="RTT v milisekundah za ukaz netem")
+    parser.add_argument("--jitter", type=float, default=0.0, help="trepetanje v milisekundah za ukaz netem")
+    parser.add_argument("--bandwidth", type=float, help="pasovna širina v Mbit/s za ukaz netem")
+    parser.add_argument("--netem-records", type=int, default=SWEEP_RECORDS, help="število vrstic pri nalaganju za ukaz netem")
+    parser.add_argument("--orders-per-user", type=int, default=ORDERS_PER_USER, help="povprečno število naročil na uporabnika")
+    parser.add_argument("--order-skew", type=float, default=ORDER_SKEW, help="eksponent Zipf porazdelitve naročil po uporabnikih (0 = enakomerno)")
+    parser.add_argument("--write-ratio", type=float, nargs="+", default=[WRITE_RATIO], help="delež pisalnih transakcij za ukaz oltp")
+    parser.add_argument("--isolation", nargs="+", help="stopnje izolacije za ukaz oltp (privzeto vse podprte)")
+    parser.add_argument("--oltp-clients", type=int, default=OLTP_CLIENTS, help="število sočasnih klientov za ukaz oltp")
+    parser.add_argument("--pool-size", type=int, help="velikost bazena povezav na cilj (privzeto dovolj za vse kliente)")
+    parser.add_argument("--pool-sizes", type=int, nargs="+", default=POOL_SIZES, help="velikosti bazena za ukaz pool")
+    parser.add_argument("--pool-clients", type=int, default=POOL_CLIENTS, help="število sočasnih klientov za ukaz pool")
+    parser.add_argument("--pool-query", default="Simple SELECT", choices=list(QUERIES), help="poizvedba za ukaz pool")
+    parser.add_argument("--workload-duration", type=float, help="trajanje obremenitve v sekundah (privzeto iz datoteke)")
+    args = parser.parse_intermixed_args(list(options) + sys.argv[1:])
+
+    unknown = [command for command in args.commands if command not in COMMANDS]
+    if unknown:
+        parser.error(f"neznan ukaz: {', '.join(unknown)} (možni: {', '.join(COMMANDS)})")
+    if not args.commands:
+        args.commands = list(commands)
+    if "check" in args.commands and "benchmark" not in args.commands[:args.commands.index("check")]:
+        parser.error("ukaz check potrebuje predhodni ukaz benchmark")
+
+    if args.only:
+        targets = [engine for engine in targets if engine.name in args.only]
+    if not targets:
+        parser.error("ni izbranih ciljev")
+
+    # Glavna povezava in največ sočasnih klientov enega ukaza
+    pool_size = args.pool_size or 1 + max(args.clients + [args.oltp_clients, args.background_clients, len(INDEXES)])
+    conns = connect_all(targets, pool_size)
+    db = None if args.no_store else open_store(args.results)
+    run_id = start_run(db, args.commands, args.records) if db else None
+
+    def save(record, *values):
+        if db:
+            return record(db, run_id, targets, conns, *values)
+
+    regressions = 0
+    for command in args.commands:
+        if command == "setup":
+            loads = run_setup(targets, conns, args.records, args.compare_methods, args.sweep_batches)
+            save(record_values, "load", "s", loads)
+        elif command == "benchmark":
+            benchmark = run_benchmark(targets, conns)
+            result_ids = save(record_samples, "benchmark", benchmark)
+            if result_ids:
+                print_plan_changes(find_plan_changes(db, result_ids))
+        elif command == "optimize":
+            run_optimize(targets, conns)
+        elif command == "advise":
+            run_advisor(targets, conns)
+        elif command == "online-index":
+            save(record_values, "index-build", "s", run_online_index(targets, conns, clients=args.background_clients))
+        elif command == "index-build":
+            save(record_values, "index-build", "s", run_index_build(targets, conns, sweep=not args.no_sweep))
+        elif command == "sizes":
+            save(record_values, "size", "bytes", run_sizes(targets, conns))
+        elif command == "load":
+            save(record_load_curves, run_load_test(targets, args.clients, args.duration, args.requests))
+        elif command == "phases":
+            run_phase_breakdown(targets, conns, args.fetch_size)
+        elif command == "prepared":
+            results = run_prepared(targets, conns)
+            for variant in ("adhoc", "prepared"):
+                by_query = {query: {name: r[variant] for name, r in by_engine.items()}
+                            for query, by_engine in results.items()}
+                save(record_samples, "prepared", by_query, variant)
+        elif command == "pipeline":
+            rtt, results = run_pipeline(targets, conns, args.pipeline_depth)
+            save(record_values, "rtt", "ns", {name: {"SELECT 1": value} for name, value in rtt.items()})
+            for variant in ("sequential", "pipeline"):
+                by_query = {query: {name: r[variant] for name, r in by_engine.items()}
+                            for query, by_engine in results.items()}
+                save(record_samples, "pipeline", by_query, variant)
+        elif command == "netem":
+            loads, query_times = run_netem(targets, conns, args.rtt, args.jitter, args.bandwidth,
+                                           args.netem_records, args.pipeline_depth)
+            save(record_values, "netem-load", "s", loads)
+            save(record_values, "netem-query", "ns", query_times)
+        elif command == "orders":
+            results = run_orders(targets, conns, args.orders_per_user, args.order_skew)
+            loads = {name: dict(r["loads"]) for name, r in results.items()}
+            for name, r in results.items():
+                if r["foreign_key"] is not None:
+                    loads[name]["dodajanje FK"] = r["foreign_key"]
+            save(record_values, "orders-load", "s", loads)
+            for label, _, _ in STATES:
+                by_query = {query: {name: r["queries"][query][label] for name, r in results.items()}
+                            for query in results[targets[0].name]["queries"]}
+                save(record_samples, "orders", by_query, label)
+        elif command == "oltp":
+            results = run_oltp_scenarios(targets, conns, args.write_ratio, args.isolation, args.oltp_clients, args.duration)
+            histograms, tps, errors = {}, {}, {}
+            for name, runs in results.items():
+                histograms[name], tps[name], errors[name] = {}, {}, {}
+                for r in runs:
+                    label = f"{r['level']}/{r['write_ratio']:g}"
+                    tps[name][label] = r["tps"]
+                    histograms[name].update({f"{label}/{tx}": h for tx, h in r["transactions"].items()})
+                    errors[name].update({f"{label}/{kind}": count for kind, count in r["errors"].items()})
+            save(record_histograms, "oltp", histograms)
+            save(record_values, "oltp-tps", "tps", tps)
+            save(record_values, "oltp-errors", "count", errors)
+        elif command == "pool":
+            costs, results = run_pool_sweep(targets, args.pool_query, args.pool_sizes, args.pool_clients, args.duration)
+            save(record_histograms, "pool-connect", costs)
+            label = lambda r: "brez" if r["size"] is None else str(r["size"])
+            save(record_values, "pool-qps", "qps", {name: {label(r): r["qps"] for r in runs} for name, runs in results.items()})
+            save(record_histograms, "pool", {
+                name: {f"{label(r)}/{kind}": r[kind] for r in runs for kind in ("latency", "wait") if r[kind]}
+                for name, runs in results.items()
+            })
+        elif command == "check":
+            baseline = load_baseline(args.baseline)
+            states = {engine.name: describe(engine, conns[engine.name]) for engine in targets}
+            regressions += print_comparison(compare(baseline, benchmark, args.threshold), baseline, states)
+        elif command == "workload":
+            results = run_workload_file(targets, conns, args.workload, args.workload_duration)
+            save(record_histograms, "workload", {name: r["queries"] for name, r in results.items()})
+    close_all(targets, conns)
+    if db:
+        db.close()
+        print(f"\n✓ Rezultati shranjeni v {args.results} (zagon #{run_id})")
+    if regressions:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+import psycopg2
+import mysql.connector
+
+PG_CONFIG = {"database": "testdb", "user": "postgres", "password": "testpass"}
+
+MYSQL_CONFIG = {"database": "testdb", "user": "testuser", "password": "testpass"}
+
+def connect_postgresql(host="localhost", port=5432):
+    """Odpre novo povezavo s PostgreSQL"""
+    return psycopg2.connect(host=host, port=port, **PG_CONFIG)
+
+def connect_mysql(host="localhost", port=3306):
+    """Odpre novo povezavo z MySQL/MariaDB
+
+    allow_local_infile je potreben za nalaganje z LOAD DATA LOCAL INFILE.
+    """
+    return mysql.connector.connect(host=host, port=port, allow_local_infile=True, **MYSQL_CONFIG)
@@ -0,0 +1,133 @@
+import random
+import resource
+import sys
+import time
+import numpy as np
+from workload import scramble_step
+
+# Število vrstic v enem paketu generiranih podatkov
+CHUNK_SIZE = 10000
+
+# Seme generatorja - vse baze in oba sistema dobijo identične podatke
+SEED = 42
+
+STATUSES = ['active', 'inactive', 'suspended']
+
+# Statusi naročil in njihovi deleži
+ORDER_STATUSES = ['pending', 'paid', 'shipped', 'cancelled']
+ORDER_STATUS_WEIGHTS = [0.1, 0.6, 0.25, 0.05]
+
+# Povprečno število naročil na uporabnika
+ORDERS_PER_USER = 5
+
+# Eksponent Zipfove porazdelitve naročil po uporabnikih (0 = enakomerno)
+ORDER_SKEW = 1.0
+
+# Naročila so razporejena v dveh letih od tega datuma
+ORDER_START = np.datetime64("2023-01-01T00:00:00")
+ORDER_PERIOD = 2 * 365 * 86400
+
+def generate_batches(num_records, chunk_size=CHUNK_SIZE, seed=SEED):
+    """Generira testne podatke v paketih fiksne velikosti (zanka po vrsticah)
+
+    V pomnilniku je naenkrat le en paket, ne glede na število zapisov.
+    """
+    rng = random.Random(seed)
+    for start in range(0, num_records, chunk_size):
+        batch = []
+        for i in range(start, min(start + chunk_size, num_records)):
+            username = f"user_{i}"
+            email = f"user_{i}@example.com"
+            status = rng.choice(STATUSES)
+            balance = round(rng.uniform(0, 10000), 2)
+            batch.append((username, email, status, balance))
+        yield batch
+
+def generate_chunk_numpy(start, stop, seed=SEED):
+    """Generira vrstice z id-ji od start do stop z vektoriziranimi NumPy operacijami
+
+    Generator je zasejan s semenom in začetkom paketa, zato je paket enak ne
+    glede na to, kateri proces ali v kakšnem vrstnem redu ga generira.
+    """
+    rng = np.random.default_rng([seed, start])
+    ids = np.arange(start, stop)
+    usernames = np.char.add("user_", ids.astype(str))
+    emails = np.char.add(usernames, "@example.com")
+    status = np.array(STATUSES)[rng.integers(0, len(STATUSES), len(ids))]
+    balance = np.round(rng.uniform(0, 10000, len(ids)), 2)
+    return list(zip(usernames.tolist(), emails.tolist(), status.tolist(), balance.tolist()))
+
+def chunk_bounds(num_records, chunk_size=CHUNK_SIZE):
+    """Vrne meje paketov (start, stop) za dano število zapisov"""
+    return [(start, min(start + chunk_size, num_records))
+            for start in range(0, num_records, chunk_size)]
+
+def generate_batches_numpy(num_records, chunk_size=CHUNK_SIZE, seed=SEED):
+    """Generira testne podatke v paketih z vektoriziranimi NumPy operacijami
+
+    Pri istem semenu in velikosti paketa so podatki identični na vseh sistemih.
+    """
+    for start, stop in chunk_bounds(num_records, chunk_size):
+        yield generate_chunk_numpy(start, stop, seed)
+
+def order_user_weights(user_ids, skew=ORDER_SKEW):
+    """Pripravi uporabnike po rangih in kumulativne uteži za generate_order_chunk_numpy
+
+    Uporabnik z rangom r dobi naročilo z verjetnostjo, sorazmerno 1/r^skew.
+    Rangi so premešani po vseh uporabnikih, zato vroči uporabniki niso na
+    istih straneh tabele. Pri skew=0 je porazdelitev enakomerna. Izračun je
+    sorazmeren številu uporabnikov, zato se opravi enkrat za vse pakete.
+    """
+    num_users = len(user_ids)
+    ranked_ids = user_ids[np.arange(num_users) * scramble_step(num_users) % num_users]
+    cdf = np.cumsum(1 / np.arange(1, num_users + 1) ** skew)
+    return ranked_ids, cdf
+
+def generate_order_chunk_numpy(start, stop, ranked_ids, cdf, seed=SEED):
+    """Generira naročila od start do stop za uporabnike iz order_user_weights
+
+    Id-ji so vzeti iz obstoječih uporabnikov, zato vrzeli v id-jih ne kršijo
+    tujega ključa.
+    """
+    rng = np.random.default_rng([seed, start, 1])
+    user_ids = ranked_ids[np.searchsorted(cdf, rng.uniform(0, cdf[-1], stop - start))]
+    seconds = rng.integers(0, ORDER_PERIOD, stop - start).astype("timedelta64[s]")
+    dates = np.char.replace(np.datetime_as_string(ORDER_START + seconds, unit="s"), "T", " ")
+    amounts = np.round(np.minimum(rng.lognormal(3.5, 1.0, stop - start), 99999), 2)
+    status = np.array(ORDER_STATUSES)[rng.choice(len(ORDER_STATUSES), stop - start, p=ORDER_STATUS_WEIGHTS)]
+    return list(zip(user_ids.tolist(), dates.tolist(), amounts.tolist(), status.tolist()))
+
+def generate_orders_numpy(num_orders, user_ids, skew=ORDER_SKEW, chunk_size=CHUNK_SIZE, seed=SEED):
+    """Generira naročila v paketih za obstoječe uporabnike user_ids (urejeno polje NumPy)
+
+    Uteži se izračunajo ob klicu, paketi pa sproti; pri istem semenu in istih
+    uporabnikih so naročila enaka na vseh sistemih.
+    """
+    ranked_ids, cdf = order_user_weights(user_ids, skew)
+    return (generate_order_chunk_numpy(start, stop, ranked_ids, cdf, seed)
+            for start, stop in chunk_bounds(num_orders, chunk_size))
+
+def peak_rss_mb():
+    """Vrne največjo porabo pomnilnika (RSS) procesa v MB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS vrne bajte, Linux in FreeBSD kilobajte
+    if sys.platform == "darwin":
+        return peak / 1024 / 1024
+    return peak / 1024
+
+def benchmark_generators(num_records):
+    """Primerja hitrost generiranja med zanko in NumPy generatorjem"""
+    results = {}
+    for name, generate in [("zanka", generate_batches), ("numpy", generate_batches_numpy)]:
+        start = time.perf_counter()
+        rows = sum(len(batch) for batch in generate(num_records))
+        elapsed = time.perf_counter() - start
+        results[name] = elapsed
+        print(f"{name:8} | {elapsed:7.2f}s | {rows/elapsed:10.0f} rows/s")
+    return results
+
+if __name__ == "__main__":
+    print("="*60)
+    print("HITROST GENERIRANJA TESTNIH PODATKOV")
+    print("="*60)
+    benchmark_generators(1000000)
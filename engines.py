@@ -0,0 +1,604 @@
+import json
+from contextlib import contextmanager
+from connections import connect_mysql, connect_postgresql
+from loaders import (
+    MYSQL_LOAD_METHODS, PG_LOAD_METHODS, compare_mysql_methods, compare_pg_methods,
+    load_mysql, load_postgresql, load_round_trips, truncate_users
+)
+from phases import mysql_modes, pg_modes
+from pool import ConnectionPool
+from workload import compile_sql
+
+INDEXES = [
+    ("idx_users_email", "CREATE INDEX idx_users_email ON users(email)"),
+    ("idx_users_status", "CREATE INDEX idx_users_status ON users(status)"),
+    ("idx_users_balance", "CREATE INDEX idx_users_balance ON users(balance)"),
+]
+
+class PostgreSQLStatement:
+    """Pripravljen stavek na strežniku PostgreSQL (PREPARE/EXECUTE)"""
+
+    def __init__(self, conn, name, sql):
+        self.name = name
+        sql, self.names = compile_sql(sql, lambda i: f"${i}")
+        self.cursor = conn.cursor()
+        self.cursor.execute(f"PREPARE {name} AS {sql}")
+        placeholders = ", ".join(["%s"] * len(self.names))
+        self.execute_sql = f"EXECUTE {name} ({placeholders})" if self.names else f"EXECUTE {name}"
+
+    def execute(self, params):
+        self.cursor.execute(self.execute_sql, [params[n] for n in self.names])
+        return self.cursor.fetchall()
+
+    def close(self):
+        self.cursor.execute(f"DEALLOCATE {self.name}")
+        self.cursor.close()
+
+class MySQLStatement:
+    """Pripravljen stavek v binarnem protokolu MySQL/MariaDB"""
+
+    def __init__(self, conn, name, sql):
+        self.name = name
+        self.sql, self.names = compile_sql(sql, lambda i: "%s")
+        self.cursor = conn.cursor(prepared=True)
+
+    def execute(self, params):
+        self.cursor.execute(self.sql, tuple(params[n] for n in self.names))
+        return self.cursor.fetchall()
+
+    def close(self):
+        self.cursor.close()
+
+class Engine:
+    """Vmesnik za eno bazo podatkov na enem gostitelju
+
+    Podrazredi določijo narečje DDL, način nalaganja, poizvedbo za velikost
+    tabel in ukaz za optimizacijo. name je oznaka v izpisih (npr. "MariaDB"
+    ali "FreeBSD"), zato je lahko ista vrsta baze v seznamu ciljev večkrat.
+    """
+    dialect = None
+    load_methods = []
+    default_load_method = None
+    tables_ddl = []
+    # Poizvedbe za opis stanja cilja ob shranjevanju rezultatov
+    settings_sql = None
+    indexes_sql = None
+    os_sql = None
+    table_bytes_sql = None
+    # Spremenljivke, ki se spreminjajo same od sebe in ne sodijo v prstni odtis nastavitev
+    volatile_settings = set()
+    drop_index_sql = None
+    # Tuji ključ orders.user_id -> users.id (ime je enako v vseh narečjih)
+    foreign_key = "fk_orders_user"
+    add_foreign_key_sql = (f"ALTER TABLE orders ADD CONSTRAINT {foreign_key} "
+                           "FOREIGN KEY (user_id) REFERENCES users(id)")
+    drop_foreign_key_sql = None
+    foreign_keys_sql = None
+    # Izpraznitev orders; števec id se vrne na 1 (InnoDB ga pri TRUNCATE ponastavi sam)
+    truncate_orders_sql = "TRUNCATE TABLE orders"
+    analyze_sql = None
+    # Stopnje izolacije transakcij, ki jih baza podpira, in ukaz za nastavitev v seji
+    isolation_levels = ["READ COMMITTED", "REPEATABLE READ", "SERIALIZABLE"]
+    isolation_sql = None
+    # Kode napak, po katerih se transakcija ponovi: {koda: vrsta}
+    retryable_errors = {}
+    # Načini gradnje indeksa: blocking zaklene pisanje v tabelo, online ne
+    index_build_modes = ["blocking", "online"]
+    # Nastavitve seje, ki vplivajo na gradnjo indeksov, z vrednostmi za preizkus
+    index_build_settings = {}
+    # Nastavitve gradnje, ki jih ni mogoče spremeniti brez ponovnega zagona strežnika
+    static_build_settings = []
+    set_session_sql = None
+    # Ponastavitev seje ob vračilu povezave v bazen (nastavitve, pripravljeni stavki)
+    reset_session_sql = None
+
+    def __init__(self, name, host="localhost", port=None):
+        self.name = name
+        self.host = host
+        self.port = port
+        self.pool = None
+
+    def connect(self):
+        raise NotImplementedError
+
+    def open_pool(self, size):
+        """Ustvari bazen povezav, iz katerega jemlje connection()"""
+        self.pool = ConnectionPool(self.connect, size, reset=self.reset_session)
+        return self.pool
+
+    def close_pool(self):
+        if self.pool:
+            self.pool.close()
+            self.pool = None
+
+    @contextmanager
+    def connection(self):
+        """Povezava za čas bloka with: iz bazena, če je odprt, sicer nova"""
+        if self.pool:
+            with self.pool.connection() as conn:
+                yield conn
+            return
+        conn = self.connect()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def reset_session(self, conn):
+        """Povrne sejo v začetno stanje, da naslednji uporabnik povezave ne podeduje nastavitev"""
+        cursor = conn.cursor()
+        cursor.execute(self.reset_session_sql)
+        cursor.close()
+        conn.commit()
+
+    def create_tables(self, conn):
+        """Ustvari (ali ponovno ustvari) testne tabele"""
+        cursor = conn.cursor()
+        for statement in self.tables_ddl:
+            cursor.execute(statement)
+        conn.commit()
+        cursor.close()
+
+    def load(self, conn, batches, method=None, **options):
+        raise NotImplementedError
+
+    def compare_load_methods(self, conn, make_batches):
+        raise NotImplementedError
+
+    def load_round_trips(self, method, num_records, **options):
+        """Število krogov do strežnika pri nalaganju z dano metodo"""
+        return load_round_trips(self.dialect, method, num_records, **options)
+
+    def execute_batch(self, conn, statements):
+        """Pošlje vse stavke v enem krogu do strežnika in prejme vse rezultate"""
+        raise NotImplementedError
+
+    def truncate(self, conn):
+        truncate_users(conn, self.dialect)
+
+    def table_sizes(self, conn):
+        raise NotImplementedError
+
+    def optimize(self, conn):
+        raise NotImplementedError
+
+    def table_bytes(self, conn):
+        """Vrne velikosti tabel v bajtih kot seznam (tabela, bajti)"""
+        return self._fetch(conn, self.table_bytes_sql)
+
+    def state(self, conn):
+        """Opis stanja cilja: nastavitve, indeksi na users, število vrstic in OS"""
+        settings = {name: value for name, value in self._fetch(conn, self.settings_sql)
+                    if name not in self.volatile_settings}
+        return {
+            "settings": settings,
+            "indexes": self.indexes(conn),
+            "rows": self._fetch(conn, "SELECT COUNT(*) FROM users")[0][0],
+            "os": self._fetch(conn, self.os_sql)[0][0],
+        }
+
+    def indexes(self, conn, table="users"):
+        """Imena indeksov na tabeli"""
+        return [row[0] for row in self._fetch(conn, self.indexes_sql.format(table=table))]
+
+    def has_foreign_key(self, conn):
+        return bool(self._fetch(conn, self.foreign_keys_sql.format(name=self.foreign_key)))
+
+    def set_foreign_key(self, conn, enabled):
+        """Doda ali odstrani tuji ključ orders.user_id; ob dodajanju se preverijo obstoječe vrstice"""
+        if enabled == self.has_foreign_key(conn):
+            return
+        cursor = conn.cursor()
+        cursor.execute(self.add_foreign_key_sql if enabled else self.drop_foreign_key_sql)
+        conn.commit()
+        cursor.close()
+
+    def set_isolation(self, conn, level):
+        """Nastavi stopnjo izolacije za vse naslednje transakcije v seji"""
+        cursor = conn.cursor()
+        cursor.execute(self.isolation_sql.format(level=level))
+        conn.commit()
+        cursor.close()
+
+    def error_code(self, error):
+        raise NotImplementedError
+
+    def error_kind(self, error):
+        """Vrsta napake za ponovitev transakcije (deadlock, serialization, lock_timeout) ali None"""
+        return self.retryable_errors.get(self.error_code(error))
+
+    def analyze(self, conn, table):
+        """Posodobi statistiko tabele za planer"""
+        cursor = conn.cursor()
+        cursor.execute(self.analyze_sql.format(table=table))
+        if cursor.description:
+            cursor.fetchall()
+        conn.commit()
+        cursor.close()
+
+    def _fetch(self, conn, sql):
+        cursor = conn.cursor()
+        cursor.execute(sql)
+        rows = cursor.fetchall()
+        cursor.close()
+        conn.commit()
+        return rows
+
+    def explain(self, conn, query):
+        """Plan izvedbe poizvedbe, poenoten med bazami
+
+        Vrne slovar z zastavicama full_scan (branje cele tabele) in sort,
+        seznamom uporabljenih indeksov, časom izvedbe in številom blokov
+        (kjer ju baza poroča), kratkim opisom oblike plana (shape) ter
+        surovim planom pod plan.
+        """
+        raise NotImplementedError
+
+    def index_bytes(self, conn, name):
+        """Velikost indeksa v bajtih (None, če ni znana)"""
+        raise NotImplementedError
+
+    def vacuum(self, conn):
+        """Počisti izbrisane vrstice, da ne upočasnjujejo naslednjih meritev"""
+        raise NotImplementedError
+
+    def create_index(self, conn, sql, mode=None):
+        """Zgradi indeks iz stavka CREATE INDEX v izbranem načinu (None: privzeto za bazo)"""
+        raise NotImplementedError
+
+    def set_session(self, conn, name, value):
+        """Nastavi spremenljivko za trenutno sejo"""
+        cursor = conn.cursor()
+        cursor.execute(self.set_session_sql.format(name=name, value=value))
+        cursor.close()
+
+    def static_settings(self, conn):
+        """Trenutne vrednosti nastavitev gradnje, ki zahtevajo ponovni zagon"""
+        return {name: self._fetch(conn, f"SELECT @@{name}")[0][0] for name in self.static_build_settings}
+
+    def drop_index(self, conn, name, table="users"):
+        cursor = conn.cursor()
+        cursor.execute(self.drop_index_sql.format(name=name, table=table))
+        conn.commit()
+        cursor.close()
+
+    def read_modes(self, conn, fetch_size):
+        raise NotImplementedError
+
+    def prepare(self, conn, name, sql):
+        """Pripravi stavek s parametri %(ime)s za ponavljajoče izvajanje"""
+        raise NotImplementedError
+
+    def version(self, conn):
+        """Vrne različico strežnika"""
+        cursor = conn.cursor()
+        cursor.execute("SELECT VERSION()")
+        version = cursor.fetchone()[0]
+        cursor.close()
+        return version
+
+class PostgreSQLEngine(Engine):
+    dialect = "postgresql"
+    load_methods = PG_LOAD_METHODS
+    default_load_method = "copy"
+    tables_ddl = [
+        "DROP TABLE IF EXISTS orders CASCADE",
+        "DROP TABLE IF EXISTS users CASCADE",
+        """
+        CREATE TABLE users (
+            id SERIAL PRIMARY KEY,
+            username VARCHAR(50) NOT NULL,
+            email VARCHAR(100) NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            status VARCHAR(20),
+            balance DECIMAL(10,2)
+        )
+        """,
+        """
+        CREATE TABLE orders (
+            id SERIAL PRIMARY KEY,
+            user_id INTEGER CONSTRAINT fk_orders_user REFERENCES users(id),
+            order_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            total_amount DECIMAL(10,2),
+            status VARCHAR(20)
+        )
+        """,
+    ]
+    settings_sql = "SELECT name, setting FROM pg_settings"
+    drop_index_sql = "DROP INDEX {name}"
+    set_session_sql = "SET {name} = '{value}'"
+    reset_session_sql = "RESET ALL; DEALLOCATE ALL"
+    index_build_settings = {
+        "maintenance_work_mem": ["64MB", "256MB", "1GB"],
+        "max_parallel_maintenance_workers": [0, 2, 4],
+    }
+    indexes_sql = "SELECT indexname FROM pg_indexes WHERE tablename = '{table}' ORDER BY indexname"
+    drop_foreign_key_sql = f"ALTER TABLE orders DROP CONSTRAINT {Engine.foreign_key}"
+    foreign_keys_sql = "SELECT conname FROM pg_constraint WHERE conname = '{name}'"
+    truncate_orders_sql = "TRUNCATE TABLE orders RESTART IDENTITY"
+    analyze_sql = "ANALYZE {table}"
+    isolation_sql = "SET SESSION CHARACTERISTICS AS TRANSACTION ISOLATION LEVEL {level}"
+    retryable_errors = {"40P01": "deadlock", "40001": "serialization", "55P03": "lock_timeout"}
+    os_sql = "SELECT split_part(split_part(version(), ' on ', 2), ',', 1)"
+    table_bytes_sql = """
+        SELECT 'users', pg_total_relation_size('users')
+        UNION ALL
+        SELECT 'orders', pg_total_relation_size('orders')
+    """
+
+    def __init__(self, name="PostgreSQL", host="localhost", port=5432):
+        super().__init__(name, host, port)
+
+    def connect(self):
+        return connect_postgresql(self.host, self.port)
+
+    def load(self, conn, batches, method=None, **options):
+        return load_postgresql(conn, batches, method or self.default_load_method, **options)
+
+    def compare_load_methods(self, conn, make_batches):
+        return compare_pg_methods(conn, make_batches, self.name, self.load_methods)
+
+    def table_sizes(self, conn):
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT
+                pg_size_pretty(pg_total_relation_size('users')) as users_size,
+                pg_size_pretty(pg_total_relation_size('orders')) as orders_size
+        """)
+        sizes = cursor.fetchone()
+        cursor.close()
+        return [("users", sizes[0]), ("orders", sizes[1])]
+
+    def optimize(self, conn):
+        cursor = conn.cursor()
+        cursor.execute("ANALYZE users")
+        conn.commit()
+        cursor.close()
+        return "ANALYZE"
+
+    def explain(self, conn, query):
+        plan = self._fetch(conn, f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {query}")[0][0][0]
+        summary = {"full_scan": False, "sort": False, "indexes": [], "plan": plan,
+                   "time_ms": plan["Execution Time"],
+                   "buffers": plan["Plan"].get("Shared Hit Blocks", 0) + plan["Plan"].get("Shared Read Blocks", 0)}
+        shape = []
+        nodes = [plan["Plan"]]
+        while nodes:
+            node = nodes.pop()
+            target = node.get("Index Name") or node.get("Relation Name")
+            shape.append(f"{node['Node Type']}({target})" if target else node["Node Type"])
+            if node["Node Type"] == "Seq Scan":
+                summary["full_scan"] = True
+            if node["Node Type"] in ("Sort", "Incremental Sort"):
+                summary["sort"] = True
+            if "Index Name" in node:
+                summary["indexes"].append(node["Index Name"])
+            nodes.extend(reversed(node.get("Plans", [])))
+        summary["shape"] = " > ".join(shape)
+        return summary
+
+    def index_bytes(self, conn, name):
+        return self._fetch(conn, f"SELECT pg_relation_size('{name}')")[0][0]
+
+    def create_index(self, conn, sql, mode=None):
+        if mode != "online":
+            cursor = conn.cursor()
+            cursor.execute(sql)
+            conn.commit()
+            cursor.close()
+            return
+        # CONCURRENTLY ne sme teči v transakciji
+        conn.autocommit = True
+        cursor = conn.cursor()
+        try:
+            cursor.execute(sql.replace("CREATE INDEX", "CREATE INDEX CONCURRENTLY", 1))
+        finally:
+            cursor.close()
+            conn.autocommit = False
+
+    def vacuum(self, conn):
+        # VACUUM ne sme teči v transakciji
+        conn.autocommit = True
+        cursor = conn.cursor()
+        cursor.execute("VACUUM users")
+        cursor.close()
+        conn.autocommit = False
+
+    def execute_batch(self, conn, statements):
+        # psycopg2 nima načina pipeline iz libpq; več stavkov v enem sporočilu
+        # preprostega protokola strežnik izvede v enem krogu. libpq prejme vse
+        # vrstice že ob execute, v Python objekte pa bi psycopg2 pretvoril le
+        # zadnji rezultat, zato se ta ne bere.
+        cursor = conn.cursor()
+        cursor.execute(";\n".join(statements))
+        cursor.close()
+
+    def error_code(self, error):
+        return getattr(error, "pgcode", None)
+
+    def read_modes(self, conn, fetch_size):
+        return pg_modes(conn, fetch_size)
+
+    def prepare(self, conn, name, sql):
+        return PostgreSQLStatement(conn, name, sql)
+
+class MySQLEngine(Engine):
+    """MySQL ali MariaDB (isti driver in narečje)"""
+    dialect = "mysql"
+    load_methods = MYSQL_LOAD_METHODS
+    default_load_method = "multirow"
+    tables_ddl = [
+        "DROP TABLE IF EXISTS orders",
+        "DROP TABLE IF EXISTS users",
+        """
+        CREATE TABLE users (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            username VARCHAR(50) NOT NULL,
+            email VARCHAR(100) NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            status VARCHAR(20),
+            balance DECIMAL(10,2)
+        ) ENGINE=InnoDB
+        """,
+        """
+        CREATE TABLE orders (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            user_id INT,
+            order_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            total_amount DECIMAL(10,2),
+            status VARCHAR(20),
+            CONSTRAINT fk_orders_user FOREIGN KEY (user_id) REFERENCES users(id)
+        ) ENGINE=InnoDB
+        """,
+    ]
+    settings_sql = "SHOW GLOBAL VARIABLES"
+    indexes_sql = """
+        SELECT DISTINCT index_name FROM information_schema.statistics
+        WHERE table_schema = DATABASE() AND table_name = '{table}'
+        ORDER BY index_name
+    """
+    drop_foreign_key_sql = f"ALTER TABLE orders DROP FOREIGN KEY {Engine.foreign_key}"
+    foreign_keys_sql = """
+        SELECT constraint_name FROM information_schema.table_constraints
+        WHERE table_schema = DATABASE() AND constraint_name = '{name}'
+    """
+    analyze_sql = "ANALYZE TABLE {table}"
+    isolation_sql = "SET SESSION TRANSACTION ISOLATION LEVEL {level}"
+    # 1020 vrne MariaDB z innodb_snapshot_isolation, ko se vrstica spremeni po začetku transakcije
+    retryable_errors = {1213: "deadlock", 1205: "lock_timeout", 1020: "serialization"}
+    os_sql = "SELECT CONCAT(@@version_compile_os, ' ', @@version_compile_machine)"
+    table_bytes_sql = """
+        SELECT table_name, data_length + index_length
+        FROM information_schema.TABLES
+        WHERE table_schema = DATABASE()
+        ORDER BY table_name
+    """
+    volatile_settings = {"gtid_executed", "gtid_purged"}
+    drop_index_sql = "DROP INDEX {name} ON {table}"
+    set_session_sql = "SET SESSION {name} = {value}"
+    # innodb_sort_buffer_size ni dinamična; od MySQL 8.0.27 gradnjo indeksov
+    # namesto nje določata innodb_ddl_buffer_size in innodb_ddl_threads (MariaDB ju nima)
+    index_build_settings = {
+        "innodb_ddl_buffer_size": [1048576, 67108864, 268435456],
+        "innodb_ddl_threads": [1, 4],
+    }
+    static_build_settings = ["innodb_sort_buffer_size"]
+
+    def __init__(self, name="MySQL", host="localhost", port=3306):
+        super().__init__(name, host, port)
+
+    def connect(self):
+        return connect_mysql(self.host, self.port)
+
+    def reset_session(self, conn):
+        # COM_RESET_CONNECTION: ponastavi spremenljivke seje in zapre pripravljene stavke brez ponovne overitve
+        conn.reset_session()
+
+    def load(self, conn, batches, method=None, **options):
+        return load_mysql(conn, batches, method or self.default_load_method, **options)
+
+    def compare_load_methods(self, conn, make_batches):
+        return compare_mysql_methods(conn, make_batches, self.name, self.load_methods)
+
+    def table_sizes(self, conn):
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT
+                table_name,
+                ROUND(((data_length + index_length) / 1024 / 1024), 2) AS size_mb
+            FROM information_schema.TABLES
+            WHERE table_schema = DATABASE()
+            ORDER BY table_name
+        """)
+        sizes = [(row[0], f"{row[1]} MB") for row in cursor.fetchall()]
+        cursor.close()
+        return sizes
+
+    def optimize(self, conn):
+        cursor = conn.cursor()
+        cursor.execute("OPTIMIZE TABLE users")
+        cursor.fetchall()
+        conn.commit()
+        cursor.close()
+        return "OPTIMIZE"
+
+    def explain(self, conn, query):
+        # EXPLAIN ANALYZE v MySQL/MariaDB ne vrača JSON, zato čas in bloki niso na voljo
+        plan = json.loads(self._fetch(conn, f"EXPLAIN FORMAT=JSON {query}")[0][0])
+        summary = {"full_scan": False, "sort": False, "indexes": [], "plan": plan,
+                   "time_ms": None, "buffers": None}
+        shape = []
+        nodes = [plan]
+        while nodes:
+            node = nodes.pop()
+            if isinstance(node, list):
+                nodes.extend(reversed(node))
+                continue
+            if not isinstance(node, dict):
+                continue
+            if node.get("access_type") == "ALL":
+                summary["full_scan"] = True
+            if node.get("using_filesort") or "filesort" in node:
+                summary["sort"] = True
+                shape.append("filesort")
+            if "access_type" in node:
+                key = f"/{node['key']}" if "key" in node else ""
+                shape.append(f"{node['access_type']}({node.get('table_name', '')}{key})")
+                if "key" in node:
+                    summary["indexes"].append(node["key"])
+            nodes.extend(reversed(list(node.values())))
+        summary["shape"] = " > ".join(shape)
+        return summary
+
+    def index_bytes(self, conn, name):
+        # Statistike v shemi mysql zahtevajo pravice izven testne baze; brez njih velikost ni znana
+        try:
+            rows = self._fetch(conn, f"""
+                SELECT stat_value * @@innodb_page_size FROM mysql.innodb_index_stats
+                WHERE database_name = DATABASE() AND table_name = 'users'
+                  AND index_name = '{name}' AND stat_name = 'size'
+            """)
+        except Exception:
+            conn.rollback()
+            return None
+        return rows[0][0] if rows else None
+
+    def create_index(self, conn, sql, mode=None):
+        # InnoDB privzeto gradi indekse brez zaklepanja, zato blocking izrecno zahteva kopijo tabele.
+        # CREATE INDEX sprejme možnosti ločene s presledkom (vejica je dovoljena le v ALTER TABLE)
+        options = {
+            None: "",
+            "blocking": " ALGORITHM=COPY LOCK=SHARED",
+            "online": " ALGORITHM=INPLACE LOCK=NONE",
+        }[mode]
+        cursor = conn.cursor()
+        cursor.execute(sql + options)
+        conn.commit()
+        cursor.close()
+
+    def vacuum(self, conn):
+        # InnoDB izbrisane vrstice počisti sam (purge)
+        pass
+
+    def set_foreign_key(self, conn, enabled):
+        super().set_foreign_key(conn, enabled)
+        # InnoDB za tuji ključ brez ustreznega indeksa sam ustvari indeks z
+        # imenom ključa; ta po odstranitvi ključa ostane in ga je treba odstraniti posebej
+        if not enabled and self.foreign_key in self.indexes(conn, "orders"):
+            self.drop_index(conn, self.foreign_key, "orders")
+
+    def execute_batch(self, conn, statements):
+        cursor = conn.cursor()
+        cursor.execute(";\n".join(statements))
+        for _ in cursor.fetchsets():
+            pass
+        cursor.close()
+
+    def error_code(self, error):
+        return getattr(error, "errno", None)
+
+    def read_modes(self, conn, fetch_size):
+        return mysql_modes(conn, fetch_size)
+
+    def prepare(self, conn, name, sql):
+        return MySQLStatement(conn, name, sql)
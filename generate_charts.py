@@ -1,181 +1,300 @@
-import matplotlib.pyplot as plt
-import numpy as np
-
-# Nastavi stil
-plt.style.use('seaborn-v0_8-darkgrid')
-plt.rcParams['figure.figsize'] = (12, 8)
-plt.rcParams['font.size'] = 12
-
-# 1. INSERT Performance Comparison
-fig, ax = plt.subplots()
-databases = ['PostgreSQL', 'MySQL', 'MariaDB']
-times = [5.22, 1.29, 0.71]
-colors = ['#336699', '#dd8800', '#116644']
-
-bars = ax.bar(databases, times, color=colors, alpha=0.8, edgecolor='black')
-ax.set_ylabel('Čas (sekunde)', fontsize=14, fontweight='bold')
-ax.set_title('INSERT Performanca - 100.000 zapisov', fontsize=16, fontweight='bold')
-ax.set_ylim(0, max(times) * 1.2)
-
-for bar, time in zip(bars, times):
-    height = bar.get_height()
-    ax.text(bar.get_x() + bar.get_width()/2., height,
-            f'{time}s',
-            ha='center', va='bottom', fontsize=11, fontweight='bold')
-
-plt.tight_layout()
-plt.savefig('chart1_insert_performance.png', dpi=300, bbox_inches='tight')
-print("✓ Graf 1 shranjen: chart1_insert_performance.png")
-plt.close()
-
-# 2. SELECT Performance - Without Indexes
-fig, ax = plt.subplots(figsize=(14, 8))
-queries = ['Simple\nSELECT', 'COUNT', 'AVG\nAgregacija', 'LIKE\nIskanje', 'Range\nPoizvedba', 'ORDER BY']
-postgres = [0.52, 4.91, 15.61, 9.06, 25.02, 16.47]
-mysql = [3.23, 6.20, 42.99, 26.80, 32.99, 28.97]
-mariadb = [0.64, 9.07, 30.08, 17.31, 27.15, 21.42]
-
-x = np.arange(len(queries))
-width = 0.25
-
-bars1 = ax.bar(x - width, postgres, width, label='PostgreSQL', color='#336699', alpha=0.8, edgecolor='black')
-bars2 = ax.bar(x, mysql, width, label='MySQL', color='#dd8800', alpha=0.8, edgecolor='black')
-bars3 = ax.bar(x + width, mariadb, width, label='MariaDB', color='#116644', alpha=0.8, edgecolor='black')
-
-ax.set_ylabel('Čas (milisekunde)', fontsize=14, fontweight='bold')
-ax.set_title('SELECT Performanca - Brez indeksov', fontsize=16, fontweight='bold')
-ax.set_xticks(x)
-ax.set_xticklabels(queries, fontsize=11)
-ax.legend(fontsize=12, loc='upper left')
-ax.grid(axis='y', alpha=0.3)
-
-plt.tight_layout()
-plt.savefig('chart2_select_no_indexes.png', dpi=300, bbox_inches='tight')
-print("✓ Graf 2 shranjen: chart2_select_no_indexes.png")
-plt.close()
-
-# 3. Index Optimization Impact - ORDER BY
-fig, ax = plt.subplots()
-databases = ['PostgreSQL', 'MySQL', 'MariaDB']
-before = [16.47, 28.97, 21.42]
-after = [0.73, 1.76, 1.61]
-
-x = np.arange(len(databases))
-width = 0.35
-
-bars1 = ax.bar(x - width/2, before, width, label='Pred indeksi', color='#cc3333', alpha=0.8, edgecolor='black')
-bars2 = ax.bar(x + width/2, after, width, label='Po indeksih', color='#33cc33', alpha=0.8, edgecolor='black')
-
-ax.set_ylabel('Čas (milisekunde)', fontsize=14, fontweight='bold')
-ax.set_title('ORDER BY Performanca - Vpliv indeksov', fontsize=16, fontweight='bold')
-ax.set_xticks(x)
-ax.set_xticklabels(databases, fontsize=12)
-ax.legend(fontsize=12)
-ax.set_ylim(0, max(before) * 1.2)
-
-plt.tight_layout()
-plt.savefig('chart3_index_impact.png', dpi=300, bbox_inches='tight')
-print("✓ Graf 3 shranjen: chart3_index_impact.png")
-plt.close()
-
-# 4. Fedora vs FreeBSD - INSERT Performance
-fig, ax = plt.subplots()
-platforms = ['Fedora ', 'FreeBSD ']
-insert_times = [10.30, 160.61]
-colors = ['#2277bb', '#bb7722']
-
-bars = ax.bar(platforms, insert_times, color=colors, alpha=0.8, edgecolor='black')
-ax.set_ylabel('Čas (sekunde)', fontsize=14, fontweight='bold')
-ax.set_title('INSERT Performanca: Fedora vs FreeBSD - 100.000 zapisov', fontsize=16, fontweight='bold')
-ax.set_ylim(0, max(insert_times) * 1.15)
-
-for bar, time in zip(bars, insert_times):
-    height = bar.get_height()
-    ax.text(bar.get_x() + bar.get_width()/2., height,
-            f'{time}s',
-            ha='center', va='bottom', fontsize=12, fontweight='bold')
-
-plt.tight_layout()
-plt.savefig('chart4_fedora_freebsd_insert.png', dpi=300, bbox_inches='tight')
-print("✓ Graf 4 shranjen: chart4_fedora_freebsd_insert.png")
-plt.close()
-
-# 5. Fedora vs FreeBSD - SELECT Performance
-fig, ax = plt.subplots(figsize=(14, 8))
-queries = ['Simple\nSELECT', 'COUNT', 'AVG\nAgregacija', 'LIKE\nIskanje', 'Range\nPoizvedba', 'ORDER BY']
-fedora = [2.55, 8.67, 20.39, 10.78, 31.66, 19.43]
-freebsd = [5.84, 9.12, 23.29, 18.55, 65.01, 17.27]
-
-x = np.arange(len(queries))
-width = 0.35
-
-bars1 = ax.bar(x - width/2, fedora, width, label='Fedora ', color='#2277bb', alpha=0.8, edgecolor='black')
-bars2 = ax.bar(x + width/2, freebsd, width, label='FreeBSD ', color='#bb7722', alpha=0.8, edgecolor='black')
-
-ax.set_ylabel('Čas (milisekunde)', fontsize=14, fontweight='bold')
-ax.set_title('SELECT Performanca: Fedora vs FreeBSD - Brez indeksov', fontsize=16, fontweight='bold')
-ax.set_xticks(x)
-ax.set_xticklabels(queries, fontsize=11)
-ax.legend(fontsize=12)
-ax.grid(axis='y', alpha=0.3)
-
-plt.tight_layout()
-plt.savefig('chart5_fedora_freebsd_select.png', dpi=300, bbox_inches='tight')
-print("✓ Graf 5 shranjen: chart5_fedora_freebsd_select.png")
-plt.close()
-
-# 6. Index Impact - Fedora vs FreeBSD ORDER BY
-fig, ax = plt.subplots()
-categories = ['Fedora\nPred', 'Fedora\nPo', 'FreeBSD\nPred', 'FreeBSD\nPo']
-times = [19.43, 0.45, 17.27, 3.50]
-colors = ['#cc3333', '#33cc33', '#cc3333', '#33cc33']
-
-bars = ax.bar(categories, times, color=colors, alpha=0.8, edgecolor='black')
-ax.set_ylabel('Čas (milisekunde)', fontsize=14, fontweight='bold')
-ax.set_title('ORDER BY Performanca - Vpliv indeksov: Fedora vs FreeBSD', fontsize=16, fontweight='bold')
-ax.set_ylim(0, max(times) * 1.3)
-
-for i, (bar, time) in enumerate(zip(bars, times)):
-    height = bar.get_height()
-    ax.text(bar.get_x() + bar.get_width()/2., height,
-            f'{time}ms',
-            ha='center', va='bottom', fontsize=11, fontweight='bold')
-
-plt.tight_layout()
-plt.savefig('chart6_os_index_impact.png', dpi=300, bbox_inches='tight')
-print("✓ Graf 6 shranjen: chart6_os_index_impact.png")
-plt.close()
-
-# 7. Storage Comparison
-fig, ax = plt.subplots()
-databases = ['PostgreSQL', 'MySQL', 'MariaDB']
-sizes = [18.0, 19.06, 19.06]
-colors = ['#336699', '#dd8800', '#116644']
-
-bars = ax.bar(databases, sizes, color=colors, alpha=0.8, edgecolor='black')
-ax.set_ylabel('Velikost (MB)', fontsize=14, fontweight='bold')
-ax.set_title('Poraba prostora - 100.000 zapisov', fontsize=16, fontweight='bold')
-ax.set_ylim(0, max(sizes) * 1.2)
-
-for bar, size in zip(bars, sizes):
-    height = bar.get_height()
-    ax.text(bar.get_x() + bar.get_width()/2., height,
-            f'{size} MB',
-            ha='center', va='bottom', fontsize=12, fontweight='bold')
-
-plt.tight_layout()
-plt.savefig('chart7_storage.png', dpi=300, bbox_inches='tight')
-print("✓ Graf 7 shranjen: chart7_storage.png")
-plt.close()
-
-print("\n" + "="*60)
-print("VSI GRAFI USPEŠNO GENERIRANI!")
-print("="*60)
-print("\nGenerirane datoteke:")
-print("  1. chart1_insert_performance.png")
-print("  2. chart2_select_no_indexes.png")
-print("  3. chart3_index_impact.png")
-print("  4. chart4_fedora_freebsd_insert.png")
-print("  5. chart5_fedora_freebsd_select.png")
-print("  6. chart6_os_index_impact.png")
-print("  7. chart7_storage.png")
\ No newline at end of file
+import argparse
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from results import RESULTS_DB
+
+# Mapa z grafi in seznam že izrisanih grafov (ime datoteke -> odtis vhodnih podatkov)
+CHART_DIR = "charts"
+MANIFEST = "manifest.json"
+
+DPI = 300
+
+# Percentili za krivulje latenc iz posameznih vzorcev
+LATENCY_PERCENTILES = [50, 75, 90, 95, 99, 99.9]
+
+# Stalne barve za znane cilje, ostali dobijo barve iz privzetega cikla
+COLORS = {
+    "PostgreSQL": "#336699",
+    "MySQL": "#dd8800",
+    "MariaDB": "#116644",
+    "Fedora": "#2277bb",
+    "FreeBSD": "#bb7722",
+}
+
+def _slug(text):
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    return re.sub(r"[^a-z0-9]+", "_", text.lower()).strip("_")
+
+def _index_state(indexes):
+    """Opis stanja indeksov na users (primarni ključ ne šteje)"""
+    names = [name for name in indexes.split(",") if name and name != "PRIMARY" and not name.endswith("_pkey")]
+    return "z indeksi" if names else "brez indeksov"
+
+def fetch_results(db, kind, runs=None, engines=None, names=None):
+    """Prebere rezultate ene vrste iz izbranih zagonov (privzeto zadnjega s to vrsto)
+
+    Vsaka vrstica dobi oznako serije: ime cilja, pri več zagonih še številko zagona.
+    """
+    sql = """
+        SELECT x.id, x.run_id, s.engine, s.indexes, x.name, x.variant, x.mean
+        FROM results x JOIN snapshots s ON s.id = x.snapshot_id
+        WHERE x.kind = ?
+    """
+    params = [kind]
+    if runs:
+        sql += f" AND x.run_id IN ({', '.join('?' * len(runs))})"
+        params += runs
+    else:
+        sql += " AND x.run_id = (SELECT MAX(run_id) FROM results WHERE kind = ?)"
+        params.append(kind)
+    rows = [
+        dict(zip(["id", "run", "engine", "indexes", "name", "variant", "mean"], row))
+        for row in db.execute(sql + " ORDER BY x.id", params)
+    ]
+    rows = [row for row in rows if (not engines or row["engine"] in engines) and (not names or row["name"] in names)]
+    several_runs = len({row["run"] for row in rows}) > 1
+    for row in rows:
+        row["label"] = f"{row['engine']} #{row['run']}" if several_runs else row["engine"]
+        row["state"] = _index_state(row["indexes"] or "")
+    return rows
+
+def _grouped(rows, category, series, value):
+    """Razvrsti vrstice v kategorije in serije za združen stolpčni graf"""
+    categories = list(dict.fromkeys(category(row) for row in rows))
+    data = {}
+    for row in rows:
+        data.setdefault(series(row), [None] * len(categories))[categories.index(category(row))] = value(row)
+    return categories, data
+
+def _chart(file, chart_type, title, ylabel, categories, series, unit="", xlabel=None, log=False):
+    return {
+        "file": file, "type": chart_type, "title": title, "xlabel": xlabel, "ylabel": ylabel,
+        "categories": categories, "series": series, "unit": unit, "log": log, "dpi": DPI,
+    }
+
+def load_charts(db, runs, engines):
+    rows = fetch_results(db, "load", runs, engines)
+    if not rows:
+        return []
+    methods = len({row["name"] for row in rows}) > len({row["label"] for row in rows})
+    categories = [f"{row['label']}\n{row['name']}" if methods else row["label"] for row in rows]
+    return [_chart("insert_performance.png", "bar", "INSERT Performanca", "Čas (sekunde)",
+                   categories, {"": [row["mean"] for row in rows]}, unit="s")]
+
+def select_charts(db, runs, engines, queries):
+    """Povprečni časi poizvedb po stanju indeksov, vpliv indeksov in percentili latenc"""
+    rows = fetch_results(db, "benchmark", runs, engines, queries)
+    charts = []
+    states = list(dict.fromkeys(row["state"] for row in rows))
+    for state in states:
+        categories, series = _grouped(
+            [row for row in rows if row["state"] == state],
+            lambda row: row["name"], lambda row: row["label"], lambda row: row["mean"] / 1e6
+        )
+        charts.append(_chart(f"select_{_slug(state)}.png", "grouped", f"SELECT Performanca - {state.capitalize()}",
+                             "Čas (milisekunde)", categories, series, unit="ms"))
+
+    for query in dict.fromkeys(row["name"] for row in rows):
+        query_rows = [row for row in rows if row["name"] == query]
+        if len(states) > 1:
+            categories, series = _grouped(
+                query_rows, lambda row: row["label"], lambda row: row["state"], lambda row: row["mean"] / 1e6
+            )
+            charts.append(_chart(f"index_impact_{_slug(query)}.png", "grouped", f"{query} - Vpliv indeksov",
+                                 "Čas (milisekunde)", categories, series, unit="ms"))
+
+        series = {}
+        for row in query_rows:
+            samples = [value for (value,) in db.execute("SELECT value FROM samples WHERE result_id = ?", (row["id"],))]
+            if samples:
+                label = f"{row['label']} ({row['state']})" if len(states) > 1 else row["label"]
+                series[label] = (np.percentile(samples, LATENCY_PERCENTILES) / 1e6).tolist()
+        if series:
+            charts.append(_chart(f"latency_{_slug(query)}.png", "line", f"{query} - Porazdelitev latenc",
+                                 "Latenca (milisekunde)", [f"p{p:g}" for p in LATENCY_PERCENTILES], series,
+                                 xlabel="Percentil", log=True))
+    return charts
+
+def concurrency_charts(db, runs, engines, queries):
+    """Prepustnost in p99 latenca glede na število sočasnih klientov"""
+    rows = fetch_results(db, "concurrency", runs, engines, queries)
+    charts = []
+    for query in dict.fromkeys(row["name"] for row in rows):
+        query_rows = sorted((row for row in rows if row["name"] == query), key=lambda row: int(row["variant"]))
+        categories, qps = _grouped(query_rows, lambda row: row["variant"], lambda row: row["label"],
+                                   lambda row: row["mean"])
+        p99 = {}
+        for row in query_rows:
+            value = db.execute("SELECT value FROM percentiles WHERE result_id = ? AND percentile = 99",
+                               (row["id"],)).fetchone()
+            p99.setdefault(row["label"], [None] * len(categories))[categories.index(row["variant"])] = (
+                value[0] / 1e6 if value else None
+            )
+        charts.append(_chart(f"throughput_{_slug(query)}.png", "line", f"{query} - Prepustnost",
+                             "Poizvedb na sekundo", categories, qps, xlabel="Sočasni klienti"))
+        charts.append(_chart(f"p99_{_slug(query)}.png", "line", f"{query} - p99 latenca",
+                             "Latenca (milisekunde)", categories, p99, xlabel="Sočasni klienti", log=True))
+    return charts
+
+def prepared_charts(db, runs, engines, queries):
+    rows = fetch_results(db, "prepared", runs, engines, queries)
+    if not rows:
+        return []
+    categories, series = _grouped(rows, lambda row: row["name"], lambda row: f"{row['label']} {row['variant']}",
+                                  lambda row: row["mean"] / 1e6)
+    return [_chart("prepared.png", "grouped", "Pripravljeni stavki vs ad-hoc SQL", "Čas (milisekunde)",
+                   categories, series, unit="ms")]
+
+def workload_charts(db, runs, engines, queries):
+    rows = fetch_results(db, "workload", runs, engines, queries)
+    if not rows:
+        return []
+    categories, series = _grouped(rows, lambda row: row["name"], lambda row: row["label"],
+                                  lambda row: row["mean"] / 1e6)
+    return [_chart("workload.png", "grouped", "Obremenitev - povprečna latenca", "Čas (milisekunde)",
+                   categories, series, unit="ms")]
+
+def storage_charts(db, runs, engines):
+    rows = fetch_results(db, "size", runs, engines)
+    if not rows:
+        return []
+    totals = {}
+    for row in rows:
+        totals[row["label"]] = totals.get(row["label"], 0) + row["mean"] / 1024 / 1024
+    return [_chart("storage.png", "bar", "Poraba prostora", "Velikost (MB)",
+                   list(totals), {"": [round(size, 2) for size in totals.values()]}, unit="MB")]
+
+def build_charts(db, runs=None, engines=None, queries=None):
+    """Sestavi opise vseh grafov iz shranjenih rezultatov"""
+    return (
+        load_charts(db, runs, engines)
+        + select_charts(db, runs, engines, queries)
+        + prepared_charts(db, runs, engines, queries)
+        + workload_charts(db, runs, engines, queries)
+        + concurrency_charts(db, runs, engines, queries)
+        + storage_charts(db, runs, engines)
+    )
+
+def _color(label, index):
+    for name, color in COLORS.items():
+        if label.startswith(name):
+            return color
+    return f"C{index}"
+
+def render_chart(chart, directory=CHART_DIR):
+    """Izriše en graf; teče v ločenem procesu"""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    plt.style.use('seaborn-v0_8-darkgrid')
+    plt.rcParams['font.size'] = 12
+    categories = chart["categories"]
+    fig, ax = plt.subplots(figsize=(14, 8) if len(categories) > 4 else (12, 8))
+
+    if chart["type"] == "bar":
+        values = next(iter(chart["series"].values()))
+        colors = [_color(category, i) for i, category in enumerate(categories)]
+        bars = ax.bar(categories, values, color=colors, alpha=0.8, edgecolor='black')
+        ax.set_ylim(0, max(values) * 1.2)
+        for bar, value in zip(bars, values):
+            ax.text(bar.get_x() + bar.get_width()/2., bar.get_height(), f'{value:.2f}{chart["unit"]}',
+                    ha='center', va='bottom', fontsize=11, fontweight='bold')
+    elif chart["type"] == "grouped":
+        x = np.arange(len(categories))
+        width = 0.8 / len(chart["series"])
+        for i, (label, values) in enumerate(chart["series"].items()):
+            offset = (i - (len(chart["series"]) - 1) / 2) * width
+            heights = [value if value is not None else 0 for value in values]
+            ax.bar(x + offset, heights, width, label=label, color=_color(label, i), alpha=0.8, edgecolor='black')
+        ax.set_xticks(x)
+        ax.set_xticklabels([category.replace(" ", "\n", 1) for category in categories], fontsize=11)
+        ax.legend(fontsize=12, loc='upper left')
+        ax.grid(axis='y', alpha=0.3)
+    else:
+        for i, (label, values) in enumerate(chart["series"].items()):
+            values = [value if value is not None else np.nan for value in values]
+            ax.plot(categories, values, marker='o', linewidth=2, label=label, color=_color(label, i))
+        ax.legend(fontsize=12, loc='upper left')
+        if chart["log"]:
+            ax.set_yscale('log')
+
+    if chart["xlabel"]:
+        ax.set_xlabel(chart["xlabel"], fontsize=14, fontweight='bold')
+    ax.set_ylabel(chart["ylabel"], fontsize=14, fontweight='bold')
+    ax.set_title(chart["title"], fontsize=16, fontweight='bold')
+
+    path = os.path.join(directory, chart["file"])
+    plt.tight_layout()
+    plt.savefig(path, dpi=chart["dpi"], bbox_inches='tight')
+    plt.close(fig)
+    return path
+
+def chart_hash(chart):
+    """Odtis vhodnih podatkov grafa; enak odtis pomeni, da ponovni izris ni potreben"""
+    return hashlib.sha256(json.dumps(chart, sort_keys=True).encode()).hexdigest()
+
+def render_all(charts, directory=CHART_DIR, workers=None, force=False):
+    """Vzporedno izriše grafe, katerih podatki so se spremenili od zadnjega izrisa
+
+    Vrne seznam izrisanih in seznam preskočenih datotek.
+    """
+    os.makedirs(directory, exist_ok=True)
+    manifest_path = os.path.join(directory, MANIFEST)
+    manifest = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+
+    pending = []
+    skipped = []
+    for chart in charts:
+        digest = chart_hash(chart)
+        if not force and manifest.get(chart["file"]) == digest and os.path.exists(os.path.join(directory, chart["file"])):
+            skipped.append(chart["file"])
+        else:
+            pending.append((chart, digest))
+
+    rendered = []
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for (chart, digest), path in zip(pending, pool.map(render_chart, [c for c, _ in pending], [directory] * len(pending))):
+                manifest[chart["file"]] = digest
+                rendered.append(path)
+                print(f"✓ Graf shranjen: {path}")
+
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return rendered, skipped
+
+def main():
+    parser = argparse.ArgumentParser(description="Grafi iz shranjenih rezultatov benchmarka")
+    parser.add_argument("--results", default=RESULTS_DB, help="baza SQLite z rezultati")
+    parser.add_argument("--runs", type=int, nargs="+", help="zagoni za primerjavo (privzeto zadnji)")
+    parser.add_argument("--engines", nargs="+", help="omeji grafe na te cilje")
+    parser.add_argument("--queries", nargs="+", help="omeji grafe na te poizvedbe")
+    parser.add_argument("--output", default=CHART_DIR, help="mapa za grafe")
+    parser.add_argument("--workers", type=int, help="število procesov za izris (privzeto število jeder)")
+    parser.add_argument("--force", action="store_true", help="izriši tudi nespremenjene grafe")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.results):
+        parser.error(f"{args.results} ne obstaja - najprej zaženi bench.py")
+    db = sqlite3.connect(args.results)
+    charts = build_charts(db, args.runs, args.engines, args.queries)
+    db.close()
+
+    rendered, skipped = render_all(charts, args.output, args.workers, args.force)
+
+    print("\n" + "="*60)
+    print(f"GRAFI GENERIRANI: {len(rendered)} izrisanih, {len(skipped)} nespremenjenih")
+    print("="*60)
+
+if __name__ == "__main__":
+    main()
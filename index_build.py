@@ -0,0 +1,89 @@
+import itertools
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Število ponovitev gradnje pri vsaki nastavitvi (velja mediana)
+BUILD_REPEATS = 3
+
+def _drop_existing(engine, conn, indexes):
+    existing = set(engine.indexes(conn))
+    for idx_name, _ in indexes:
+        if idx_name in existing:
+            engine.drop_index(conn, idx_name)
+
+def _build_one(engine, idx_sql, settings):
+    """Zgradi en indeks na ločeni povezavi z nastavitvami seje; vrne čas v sekundah"""
+    with engine.connection() as conn:
+        for name, value in settings.items():
+            engine.set_session(conn, name, value)
+        start = time.perf_counter()
+        engine.create_index(conn, idx_sql)
+        return time.perf_counter() - start
+
+def build_sequential(engine, conn, indexes, settings=None):
+    """Gradi indekse enega za drugim; vrne čase po indeksih in skupni čas"""
+    _drop_existing(engine, conn, indexes)
+    times = {idx_name: _build_one(engine, idx_sql, settings or {}) for idx_name, idx_sql in indexes}
+    return times, sum(times.values())
+
+def build_parallel(engine, conn, indexes, settings=None):
+    """Gradi vse indekse hkrati, vsakega na svoji povezavi
+
+    Vrne čase po indeksih in skupni (stenski) čas. PostgreSQL dovoli več
+    sočasnih CREATE INDEX na isti tabeli, MySQL/MariaDB jih zaradi
+    zaklepanja metapodatkov tabele v veliki meri izvede zaporedno.
+    """
+    _drop_existing(engine, conn, indexes)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(indexes)) as pool:
+        futures = {idx_name: pool.submit(_build_one, engine, idx_sql, settings or {}) for idx_name, idx_sql in indexes}
+        times = {idx_name: future.result() for idx_name, future in futures.items()}
+    return times, time.perf_counter() - start
+
+def compare_parallel(engine, conn, indexes, repeats=BUILD_REPEATS):
+    """Mediana skupnega časa zaporedne in vzporedne gradnje"""
+    results = {}
+    for label, build in [("zaporedno", build_sequential), ("vzporedno", build_parallel)]:
+        results[label] = statistics.median(build(engine, conn, indexes)[1] for _ in range(repeats))
+    return results
+
+def sweep_settings(engine, conn, indexes, grid=None, repeats=BUILD_REPEATS):
+    """Izmeri zaporedno gradnjo indeksov za vse kombinacije nastavitev
+
+    grid je {nastavitev: [vrednosti]}, privzeto engine.index_build_settings.
+    Vrne seznam (nastavitve, {indeks: mediana časa}, skupaj); kombinacije,
+    ki jih strežnik zavrne, so izpisane in preskočene.
+    """
+    grid = grid or engine.index_build_settings
+    names = list(grid)
+    results = []
+    for values in itertools.product(*(grid[name] for name in names)):
+        settings = dict(zip(names, values))
+        try:
+            runs = [build_sequential(engine, conn, indexes, settings)[0] for _ in range(repeats)]
+        except Exception as e:
+            conn.rollback()
+            print(f"  ✗ {settings}: {e}")
+            continue
+        times = {idx_name: statistics.median(run[idx_name] for run in runs) for idx_name, _ in indexes}
+        results.append((settings, times, sum(times.values())))
+    return results
+
+def print_parallel(name, results):
+    speedup = results["zaporedno"] / results["vzporedno"]
+    print(f"{name:12} | Zaporedno: {results['zaporedno']:7.3f}s | Vzporedno: {results['vzporedno']:7.3f}s | "
+          f"Pospešitev: {speedup:.2f}x")
+
+def print_sweep(name, results, indexes):
+    """Izpiše čase gradnje po nastavitvah in označi najhitrejšo kombinacijo"""
+    if not results:
+        print(f"{name}: nobena kombinacija nastavitev ni bila izvedljiva")
+        return
+    fastest = min(results, key=lambda r: r[2])
+    print(f"\n{name}:")
+    for settings, times, total in results:
+        label = ", ".join(f"{k}={v}" for k, v in settings.items())
+        per_index = " | ".join(f"{idx_name}: {times[idx_name]:6.3f}s" for idx_name, _ in indexes)
+        marker = " ← najhitreje" if (settings, times, total) == fastest else ""
+        print(f"  {label:64} | {per_index} | Skupaj: {total:6.3f}s{marker}")
@@ -0,0 +1,95 @@
+import math
+import time
+from array import array
+
+# Največja latenca, ki jo histogram loči (1 ura v nanosekundah)
+HIGHEST_NS = 3600 * 10**9
+
+# Število pomembnih decimalnih mest (relativna napaka 0.1 %)
+SIGNIFICANT_DIGITS = 3
+
+def now_ns():
+    """Monotona ura z nanosekundno ločljivostjo"""
+    return time.perf_counter_ns()
+
+class LatencyHistogram:
+    """Histogram latenc v slogu HdrHistogram
+
+    Vrednosti (v nanosekundah) so razvrščene v logaritemske vedre z linearnimi
+    podvedri, zato je poraba pomnilnika konstantna ne glede na število vzorcev,
+    relativna napaka pa omejena s SIGNIFICANT_DIGITS. Histograme z enakimi
+    nastavitvami lahko združujemo (npr. po nitih ali po zagonih).
+    """
+
+    def __init__(self, highest=HIGHEST_NS, significant_digits=SIGNIFICANT_DIGITS):
+        self.highest = highest
+        self.significant_digits = significant_digits
+        largest_single_unit = 2 * 10**significant_digits
+        self.sub_bucket_magnitude = math.ceil(math.log2(largest_single_unit))
+        self.sub_bucket_count = 1 << self.sub_bucket_magnitude
+        self.sub_bucket_half_count = self.sub_bucket_count // 2
+        self.sub_bucket_mask = self.sub_bucket_count - 1
+
+        bucket_count = 1
+        smallest_untrackable = self.sub_bucket_count
+        while smallest_untrackable <= highest:
+            smallest_untrackable <<= 1
+            bucket_count += 1
+        self.counts = array("Q", bytes(8 * (bucket_count + 1) * self.sub_bucket_half_count))
+
+        self.total = 0
+        self.sum = 0
+        self.min = None
+        self.max = None
+
+    def _index(self, value):
+        bucket = (value | self.sub_bucket_mask).bit_length() - self.sub_bucket_magnitude
+        sub_bucket = value >> bucket
+        return ((bucket + 1) << (self.sub_bucket_magnitude - 1)) + sub_bucket - self.sub_bucket_half_count
+
+    def _highest_equivalent(self, index):
+        bucket = (index >> (self.sub_bucket_magnitude - 1)) - 1
+        sub_bucket = (index & (self.sub_bucket_half_count - 1)) + self.sub_bucket_half_count
+        if bucket < 0:
+            sub_bucket -= self.sub_bucket_half_count
+            bucket = 0
+        return ((sub_bucket + 1) << bucket) - 1
+
+    def record(self, value_ns, count=1):
+        """Zabeleži latenco v nanosekundah"""
+        value_ns = min(max(int(value_ns), 0), self.highest)
+        self.counts[self._index(value_ns)] += count
+        self.total += count
+        self.sum += value_ns * count
+        self.min = value_ns if self.min is None else min(self.min, value_ns)
+        self.max = value_ns if self.max is None else max(self.max, value_ns)
+
+    def merge(self, other):
+        """Prišteje drug histogram z enakimi nastavitvami"""
+        if (other.highest, other.significant_digits) != (self.highest, self.significant_digits):
+            raise ValueError("Histogrami imajo različne nastavitve")
+        for i, count in enumerate(other.counts):
+            if count:
+                self.counts[i] += count
+        self.total += other.total
+        self.sum += other.sum
+        if other.total:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+
+    def percentile(self, p):
+        """Vrne p-ti percentil v nanosekundah"""
+        if not self.total:
+            return 0
+        target = max(1, math.ceil(p / 100 * self.total))
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self._highest_equivalent(i), self.max)
+        return self.max
+
+    def mean(self):
+        """Povprečna latenca v nanosekundah"""
+        return self.sum / self.total if self.total else 0
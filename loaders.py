@@ -0,0 +1,262 @@
+import csv
+import io
+import math
+import os
+import tempfile
+import time
+from psycopg2.extras import execute_batch, execute_values
+from datagen import CHUNK_SIZE
+
+# Metode nalaganja za PostgreSQL
+PG_LOAD_METHODS = ["executemany", "execute_values", "copy", "execute_batch"]
+
+# Metode nalaganja za MySQL/MariaDB
+MYSQL_LOAD_METHODS = ["executemany", "multirow", "load_data"]
+
+# Velikost strani za execute_values
+PAGE_SIZE = 1000
+
+# Število INSERT stavkov, ki jih execute_batch pošlje strežniku v enem sporočilu
+BATCH_PAGE_SIZE = 100
+
+# Velikost paketa za večvrstične INSERT stavke (commit po vsakem paketu)
+BATCH_SIZE = 1000
+
+# Velikosti paketov za iskanje točke nasičenja
+BATCH_SIZES = [100, 500, 1000, 5000, 10000, 50000]
+
+USER_COLUMNS = "username, email, status, balance"
+ORDER_COLUMNS = "user_id, order_date, total_amount, status"
+
+def insert_sql(table, columns):
+    """INSERT stavek z eno vrstico parametrov za dano tabelo in stolpce"""
+    placeholders = ", ".join(["%s"] * len(columns.split(",")))
+    return f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+
+def _copy_value(value):
+    """Pretvori vrednost v tekstovni format za COPY"""
+    if value is None:
+        return "\\N"
+    return (str(value)
+            .replace("\\", "\\\\")
+            .replace("\t", "\\t")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r"))
+
+def copy_buffer(data):
+    """Zapiše vrstice v pomnilniški buffer za COPY FROM STDIN"""
+    buffer = io.StringIO()
+    for row in data:
+        buffer.write("\t".join(_copy_value(v) for v in row))
+        buffer.write("\n")
+    buffer.seek(0)
+    return buffer
+
+def load_postgresql(conn, batches, method="copy", page_size=PAGE_SIZE, batch_page_size=BATCH_PAGE_SIZE,
+                    table="users", columns=USER_COLUMNS):
+    """Vstavi pakete podatkov v PostgreSQL z izbrano metodo
+
+    Metoda execute_batch (psycopg2.extras) združi po batch_page_size
+    posameznih INSERT stavkov v eno sporočilo; to ni način pipeline iz
+    libpq. Vrne število vstavljenih vrstic.
+    """
+    sql = insert_sql(table, columns)
+    cursor = conn.cursor()
+    rows = 0
+    for batch in batches:
+        if method == "executemany":
+            cursor.executemany(sql, batch)
+        elif method == "execute_values":
+            execute_values(
+                cursor,
+                f"INSERT INTO {table} ({columns}) VALUES %s",
+                batch,
+                page_size=page_size
+            )
+        elif method == "copy":
+            cursor.copy_expert(
+                f"COPY {table} ({columns}) FROM STDIN",
+                copy_buffer(batch)
+            )
+        elif method == "execute_batch":
+            execute_batch(cursor, sql, batch, page_size=batch_page_size)
+        else:
+            raise ValueError(f"Neznana metoda nalaganja: {method}")
+        rows += len(batch)
+    conn.commit()
+    cursor.close()
+    return rows
+
+def _rebatch(batches, batch_size):
+    """Preoblikuje tok paketov v pakete dane velikosti"""
+    pending = []
+    for batch in batches:
+        pending.extend(batch)
+        while len(pending) >= batch_size:
+            yield pending[:batch_size]
+            pending = pending[batch_size:]
+    if pending:
+        yield pending
+
+def _load_data_infile(cursor, batches, table="users", columns=USER_COLUMNS):
+    """Zapiše pakete v začasni CSV in jih naloži z LOAD DATA LOCAL INFILE"""
+    rows = 0
+    fd, path = tempfile.mkstemp(suffix=".csv")
+    try:
+        with os.fdopen(fd, "w", newline="") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            for batch in batches:
+                writer.writerows(batch)
+                rows += len(batch)
+        cursor.execute(f"""
+            LOAD DATA LOCAL INFILE '{path}'
+            INTO TABLE {table}
+            FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '"'
+            LINES TERMINATED BY '\\n'
+            ({columns})
+        """)
+    finally:
+        os.remove(path)
+    return rows
+
+def load_mysql(conn, batches, method="multirow", batch_size=BATCH_SIZE, table="users", columns=USER_COLUMNS):
+    """Vstavi pakete podatkov v MySQL/MariaDB z izbrano metodo
+
+    Metoda load_data zahteva povezavo z allow_local_infile=True
+    in vklopljen local_infile na strežniku. Vrne število vstavljenih vrstic.
+    """
+    cursor = conn.cursor()
+    rows = 0
+    if method == "executemany":
+        for batch in batches:
+            cursor.executemany(insert_sql(table, columns), batch)
+            rows += len(batch)
+        conn.commit()
+    elif method == "multirow":
+        for batch in _rebatch(batches, batch_size):
+            values = ", ".join([f"({', '.join(['%s'] * len(batch[0]))})"] * len(batch))
+            params = [v for row in batch for v in row]
+            cursor.execute(f"INSERT INTO {table} ({columns}) VALUES {values}", params)
+            conn.commit()
+            rows += len(batch)
+    elif method == "load_data":
+        rows = _load_data_infile(cursor, batches, table, columns)
+        conn.commit()
+    else:
+        raise ValueError(f"Neznana metoda nalaganja: {method}")
+    cursor.close()
+    return rows
+
+def load_round_trips(dialect, method, num_records, batch_rows=CHUNK_SIZE, page_size=PAGE_SIZE,
+                     batch_size=BATCH_SIZE, batch_page_size=BATCH_PAGE_SIZE):
+    """Ocena števila krogov do strežnika pri nalaganju num_records vrstic v paketih po batch_rows
+
+    Ocena ni izmerjena, temveč izračunana iz velikosti paketov: šteje stavke
+    in potrditve, na katerih odgovor odjemalec čaka. COPY in
+    LOAD DATA LOCAL INFILE štejeta dva kroga (začetek prenosa in zaključek),
+    executemany v MySQL Connectorju INSERT prepiše v en večvrstični stavek.
+    """
+    batches = [batch_rows] * (num_records // batch_rows)
+    if num_records % batch_rows:
+        batches.append(num_records % batch_rows)
+    if dialect == "postgresql":
+        per_batch = {
+            "executemany": lambda rows: rows,
+            "execute_values": lambda rows: math.ceil(rows / page_size),
+            "copy": lambda rows: 2,
+            "execute_batch": lambda rows: math.ceil(rows / batch_page_size),
+        }[method]
+        return sum(per_batch(rows) for rows in batches) + 1
+    if method == "executemany":
+        return len(batches) + 1
+    if method == "multirow":
+        return 2 * math.ceil(num_records / batch_size)
+    if method == "load_data":
+        return 3
+    raise ValueError(f"Neznana metoda nalaganja: {method}")
+
+def timed_load(load, conn, make_batches, name, method, label=None, **options):
+    """Izmeri čas nalaganja in izpiše hitrost
+
+    make_batches vrne svež tok paketov, zato generiranje teče sočasno z
+    vstavljanjem in je vključeno v izmerjeni čas.
+    """
+    start_time = time.perf_counter()
+    rows = load(conn, make_batches(), method, **options)
+    elapsed = time.perf_counter() - start_time
+    print(f"✓ {name} INSERT ({label or method}): {elapsed:.2f}s ({rows/elapsed:.0f} records/s)")
+    return elapsed
+
+def truncate_users(conn, dialect="postgresql"):
+    """Izprazni tabelo users med zaporednimi nalaganji"""
+    cursor = conn.cursor()
+    if dialect == "postgresql":
+        cursor.execute("TRUNCATE users RESTART IDENTITY CASCADE")
+    else:
+        # TRUNCATE v InnoDB ni dovoljen na tabeli, na katero kaže tuji ključ
+        cursor.execute("DELETE FROM orders")
+        cursor.execute("DELETE FROM users")
+        cursor.execute("ALTER TABLE users AUTO_INCREMENT = 1")
+    conn.commit()
+    cursor.close()
+
+def compare_pg_methods(conn, make_batches, name, methods=PG_LOAD_METHODS):
+    """Naloži iste podatke z vsemi metodami in vrne čase po metodah
+
+    Tabela ostane napolnjena z zadnjo metodo.
+    """
+    results = {}
+    for i, method in enumerate(methods):
+        if i > 0:
+            truncate_users(conn)
+        results[method] = timed_load(load_postgresql, conn, make_batches, name, method)
+    return results
+
+def compare_mysql_methods(conn, make_batches, name, methods=MYSQL_LOAD_METHODS, batch_size=BATCH_SIZE):
+    """Naloži iste podatke v MySQL/MariaDB z vsemi metodami
+
+    Metoda, ki je strežnik ne dovoli (npr. load_data pri izklopljenem
+    local_infile), se izpusti. Tabela ostane napolnjena z zadnjo uspešno metodo.
+    """
+    results = {}
+    for i, method in enumerate(methods):
+        if i > 0:
+            truncate_users(conn, "mysql")
+        try:
+            results[method] = timed_load(load_mysql, conn, make_batches, name, method, batch_size=batch_size)
+        except Exception as e:
+            conn.rollback()
+            print(f"✗ {name} INSERT ({method}): ni na voljo ({e})")
+    if results and method not in results:
+        truncate_users(conn, "mysql")
+        load_mysql(conn, make_batches(), list(results)[-1], batch_size=batch_size)
+    return results
+
+def sweep_batch_sizes(conn, make_batches, name, batch_sizes=BATCH_SIZES):
+    """Izmeri večvrstični INSERT pri različnih velikostih paketov
+
+    Vrne čase po velikosti paketa; tabela ostane napolnjena z zadnjim nalaganjem.
+    """
+    results = {}
+    for i, batch_size in enumerate(batch_sizes):
+        if i > 0:
+            truncate_users(conn, "mysql")
+        results[batch_size] = timed_load(
+            load_mysql, conn, make_batches, name, "multirow",
+            label=f"multirow, paket {batch_size}", batch_size=batch_size
+        )
+    return results
+
+def print_load_results(results, num_records, header="Metoda", round_trips=None):
+    """Izpiše primerjavo metod nalaganja, po želji z oceno števila krogov do strežnika (load_round_trips)"""
+    if round_trips is None:
+        print(f"{header:16} | {'Čas':>8} | {'Records/s':>10}")
+        print("-" * 40)
+        for method, elapsed in results.items():
+            print(f"{str(method):16} | {elapsed:7.2f}s | {num_records/elapsed:10.0f}")
+        return
+    print(f"{header:16} | {'Čas':>8} | {'Records/s':>10} | {'Krogi (ocena)':>13} | {'Vrstic/krog':>11}")
+    print("-" * 72)
+    for method, elapsed in results.items():
+        trips = round_trips[method]
+        print(f"{str(method):16} | {elapsed:7.2f}s | {num_records/elapsed:10.0f} | {trips:13} | {num_records/trips:11.1f}")
@@ -0,0 +1,107 @@
+import threading
+from latency import LatencyHistogram, now_ns
+
+# Trajanje merjenja za posamezno število klientov (sekunde)
+DURATION = 10
+
+# Število sočasnih klientov za krivuljo skaliranja
+CLIENT_COUNTS = [1, 2, 4, 8, 16, 32]
+
+PERCENTILES = [50, 95, 99, 99.9]
+
+def _client(connection, query, barrier, duration, requests, histograms, errors):
+    """En klient: na svoji povezavi ponavlja poizvedbo do roka ali števila zahtev"""
+    histogram = LatencyHistogram()
+    failed = 0
+    try:
+        with connection() as conn:
+            barrier.wait()
+            deadline = now_ns() + int(duration * 1e9)
+            while True:
+                if requests is not None and histogram.total + failed >= requests:
+                    break
+                if requests is None and now_ns() >= deadline:
+                    break
+                cursor = conn.cursor()
+                start = now_ns()
+                try:
+                    cursor.execute(query)
+                    cursor.fetchall()
+                    histogram.record(now_ns() - start)
+                except Exception:
+                    # PostgreSQL po napaki zavrne vse do preklica transakcije
+                    conn.rollback()
+                    failed += 1
+                finally:
+                    cursor.close()
+    except threading.BrokenBarrierError:
+        return
+    except Exception:
+        # Ostali klienti in run_load ne smejo čakati na klienta, ki se ni povezal
+        barrier.abort()
+        raise
+    histograms.append(histogram)
+    errors.append(failed)
+
+def summarize(histogram, clients, errors, elapsed):
+    """Povzame združeni histogram v QPS in percentile (v sekundah)"""
+    result = {
+        "clients": clients,
+        "requests": histogram.total,
+        "errors": errors,
+        "qps": histogram.total / elapsed,
+        "histogram": histogram,
+    }
+    for p in PERCENTILES:
+        result[f"p{p:g}"] = histogram.percentile(p) / 1e9
+    return result
+
+def run_load(connection, query, clients, duration=DURATION, requests=None):
+    """Izvaja poizvedbo iz več sočasnih klientov
+
+    Vsak klient ima svojo povezavo (connection je npr. Engine.connection) in
+    svoj histogram; vzpostavljanje povezav ni vključeno v merjenje. Če je
+    podan requests, vsak klient izvede toliko zahtev, sicer teče duration
+    sekund. Vrne QPS, percentile in število napak.
+    """
+    histograms = []
+    errors = []
+    # Klienti in glavna nit se srečajo na pregradi, ko so vse povezave vzpostavljene
+    barrier = threading.Barrier(clients + 1)
+    threads = [
+        threading.Thread(target=_client, args=(connection, query, barrier, duration, requests, histograms, errors))
+        for _ in range(clients)
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        barrier.wait()
+    except threading.BrokenBarrierError:
+        for thread in threads:
+            thread.join()
+        raise RuntimeError("vsi klienti se niso mogli povezati")
+    start = now_ns()
+    for thread in threads:
+        thread.join()
+    elapsed = (now_ns() - start) / 1e9
+
+    merged = LatencyHistogram()
+    for histogram in histograms:
+        merged.merge(histogram)
+    return summarize(merged, clients, sum(errors), elapsed)
+
+def print_load_result(name, result):
+    """Izpiše rezultat obremenitvenega testa v eni vrstici"""
+    print(f"{name:12} | Klienti: {result['clients']:3} | QPS: {result['qps']:9.1f} | "
+          f"p50: {result['p50']*1000:7.2f}ms | p95: {result['p95']*1000:7.2f}ms | "
+          f"p99: {result['p99']*1000:7.2f}ms | p99.9: {result['p99.9']*1000:7.2f}ms | "
+          f"Napake: {result['errors']}")
+
+def load_curve(connection, query, name, client_counts=CLIENT_COUNTS, duration=DURATION, requests=None):
+    """Izmeri krivuljo skaliranja za različno število klientov"""
+    results = []
+    for clients in client_counts:
+        result = run_load(connection, query, clients, duration, requests)
+        print_load_result(name, result)
+        results.append(result)
+    return results
@@ -0,0 +1,161 @@
+import queue
+import random
+import socket
+import threading
+import time
+from datagen import generate_batches_numpy
+from pipeline import QUERY_DEPTH, compare_pipeline
+
+# Privzete vrednosti RTT za preizkus (milisekunde)
+RTTS = [0, 1, 5, 10, 25, 50]
+
+# Število vrstic pri merjenju nalaganja skozi posrednika (executemany pri 50 ms traja ~RTT na vrstico)
+SWEEP_RECORDS = 1000
+
+# Seme generatorja trepetanja, da so meritve ponovljive
+SEED = 42
+
+# Velikost bralnega medpomnilnika posrednika
+RECV_SIZE = 65536
+
+class LatencyProxy:
+    """Lokalni TCP posrednik, ki posnema oddaljenega strežnika
+
+    Vsaka smer doda polovico rtt_ms zakasnitve in enakomerno trepetanje
+    ±jitter_ms/2; bandwidth_mbit omeji hitrost prenosa. Vrstni red bajtov
+    se ohrani, zato trepetanje ne more prehiteti prej poslanih podatkov.
+    """
+
+    def __init__(self, host, port, rtt_ms=0.0, jitter_ms=0.0, bandwidth_mbit=None, seed=SEED):
+        self.target = (host, port)
+        self.one_way = rtt_ms / 2000
+        self.jitter = jitter_ms / 1000
+        self.bandwidth = bandwidth_mbit * 1e6 / 8 if bandwidth_mbit else None
+        self.seed = seed
+        self.sockets = []
+        self.listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.listener.bind(("127.0.0.1", 0))
+        self.listener.listen()
+        self.host, self.port = self.listener.getsockname()
+
+    def __enter__(self):
+        threading.Thread(target=self._accept, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.listener.close()
+        for sock in self.sockets:
+            sock.close()
+
+    def _accept(self):
+        connections = 0
+        while True:
+            try:
+                client, _ = self.listener.accept()
+            except OSError:
+                return
+            upstream = socket.create_connection(self.target)
+            for sock in (client, upstream):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                self.sockets.append(sock)
+            connections += 1
+            for i, (src, dst) in enumerate([(client, upstream), (upstream, client)]):
+                rng = random.Random(f"{self.seed}/{connections}/{i}")
+                self._pipe(src, dst, rng)
+
+    def _pipe(self, src, dst, rng):
+        """Prenaša podatke iz src v dst z zakasnitvijo; bralec in pošiljatelj sta ločeni niti"""
+        pending = queue.Queue()
+
+        def read():
+            deliver_at = link_free_at = 0.0
+            while True:
+                try:
+                    data = src.recv(RECV_SIZE)
+                except OSError:
+                    data = b""
+                now = time.perf_counter()
+                if self.bandwidth and data:
+                    link_free_at = max(link_free_at, now) + len(data) / self.bandwidth
+                    now = link_free_at
+                delay = self.one_way + rng.uniform(-self.jitter / 2, self.jitter / 2)
+                deliver_at = max(deliver_at, now + max(delay, 0.0))
+                pending.put((deliver_at, data))
+                if not data:
+                    return
+
+        def send():
+            while True:
+                deliver_at, data = pending.get()
+                wait = deliver_at - time.perf_counter()
+                if wait > 0:
+                    time.sleep(wait)
+                try:
+                    if not data:
+                        dst.shutdown(socket.SHUT_WR)
+                        return
+                    dst.sendall(data)
+                except OSError:
+                    return
+
+        threading.Thread(target=read, daemon=True).start()
+        threading.Thread(target=send, daemon=True).start()
+
+def load_time(engine, conn, method, records=SWEEP_RECORDS):
+    """Čas nalaganja records vrstic z metodo method v sekundah; vrstice se nato izbrišejo"""
+    cursor = conn.cursor()
+    cursor.execute("SELECT MAX(id) FROM users")
+    max_id = cursor.fetchone()[0] or 0
+    conn.commit()
+    start = time.perf_counter()
+    engine.load(conn, generate_batches_numpy(records), method)
+    elapsed = time.perf_counter() - start
+    cursor.execute(f"DELETE FROM users WHERE id > {max_id}")
+    conn.commit()
+    cursor.close()
+    return elapsed
+
+def sweep_rtt(engine, queries, rtts=RTTS, jitter_ms=0.0, bandwidth_mbit=None,
+              records=SWEEP_RECORDS, depth=QUERY_DEPTH):
+    """Izmeri metode nalaganja in načine izvajanja poizvedb pri vseh RTT
+
+    Vsak RTT dobi svojega posrednika pred istim strežnikom, zato se razlikuje
+    le omrežje. Vrne ({metoda: {rtt: s}}, {poizvedba/način: {rtt: ns na poizvedbo}}).
+    """
+    loads = {method: {} for method in engine.load_methods}
+    queries_by_mode = {}
+    for rtt in rtts:
+        with LatencyProxy(engine.host, engine.port, rtt, jitter_ms, bandwidth_mbit) as proxy:
+            proxied = type(engine)(f"{engine.name} +{rtt:g}ms", proxy.host, proxy.port)
+            conn = proxied.connect()
+            try:
+                for method in engine.load_methods:
+                    loads[method][rtt] = load_time(proxied, conn, method, records)
+                for name, query in queries.items():
+                    result = compare_pipeline(proxied, conn, query, depth)
+                    for mode, label in [("sequential", "zaporedno"), ("pipeline", "paket")]:
+                        queries_by_mode.setdefault(f"{name}/{label}", {})[rtt] = result[mode]["mean"]
+            finally:
+                conn.close()
+        print(f"  ✓ RTT {rtt:g} ms")
+    return loads, queries_by_mode
+
+def print_rtt_sweep(name, loads, queries_by_mode, rtts, records=SWEEP_RECORDS):
+    """Izpiše hitrost nalaganja in čas poizvedb po RTT ter upad pri največjem RTT"""
+    columns = " | ".join(f"{f'{rtt:g} ms':>9}" for rtt in rtts)
+    print(f"\n{name} - INSERT {records} vrstic (records/s):")
+    print(f"{'Metoda':32} | {columns} | Upad")
+    print("-" * (45 + 12 * len(rtts)))
+    for method, by_rtt in loads.items():
+        values = " | ".join(f"{records / by_rtt[rtt]:9.0f}" for rtt in rtts)
+        print(f"{method:32} | {values} | {by_rtt[rtts[-1]] / by_rtt[rtts[0]]:5.1f}x")
+    print(f"\n{name} - poizvedbe (ms na poizvedbo):")
+    print(f"{'Poizvedba/način':32} | {columns} | Upad")
+    print("-" * (45 + 12 * len(rtts)))
+    for label, by_rtt in queries_by_mode.items():
+        values = " | ".join(f"{by_rtt[rtt] / 1e6:9.3f}" for rtt in rtts)
+        print(f"{label:32} | {values} | {by_rtt[rtts[-1]] / by_rtt[rtts[0]]:5.1f}x")
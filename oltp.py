@@ -0,0 +1,197 @@
+import random
+import threading
+from datagen import ORDER_STATUSES
+from latency import LatencyHistogram, now_ns
+from workload import SEED, make_param
+
+# Število sočasnih klientov
+CLIENTS = 8
+
+# Trajanje enega preizkusa (sekunde)
+DURATION = 10
+
+# Privzeti delež pisalnih transakcij
+WRITE_RATIO = 0.5
+
+# Uteži pisalnih transakcij
+WRITE_WEIGHTS = {"Prenos stanja": 50, "Novo naročilo": 30, "Sprememba statusa": 20}
+
+# Eksponent Zipfove porazdelitve uporabnikov; vroči uporabniki povzročijo tekmovanje za zaklepe
+HOT_KEY_SKEW = 1.1
+
+# Največje število ponovitev transakcije po zastoju ali napaki serializacije
+MAX_RETRIES = 5
+
+# Vrste napak, po katerih se transakcija ponovi (glej Engine.retryable_errors)
+ERROR_KINDS = ["deadlock", "serialization", "lock_timeout"]
+
+def point_read(cursor, pick_user, rng, order_ids):
+    user_id = pick_user()
+    cursor.execute("SELECT username, status, balance FROM users WHERE id = %s", (user_id,))
+    cursor.fetchall()
+    cursor.execute("SELECT id, order_date, total_amount, status FROM orders "
+                   "WHERE user_id = %s ORDER BY order_date DESC LIMIT 5", (user_id,))
+    cursor.fetchall()
+
+def transfer(cursor, pick_user, rng, order_ids):
+    # Vrstici se zakleneta v naključnem vrstnem redu, kot v aplikaciji brez urejanja ključev
+    source, target = pick_user(), pick_user()
+    amount = round(rng.uniform(1, 100), 2)
+    cursor.execute("UPDATE users SET balance = balance - %s WHERE id = %s", (amount, source))
+    cursor.execute("UPDATE users SET balance = balance + %s WHERE id = %s", (amount, target))
+
+def new_order(cursor, pick_user, rng, order_ids):
+    user_id = pick_user()
+    amount = round(rng.uniform(5, 500), 2)
+    cursor.execute("INSERT INTO orders (user_id, total_amount, status) VALUES (%s, %s, 'pending')",
+                   (user_id, amount))
+    cursor.execute("UPDATE users SET balance = balance - %s WHERE id = %s", (amount, user_id))
+
+def change_status(cursor, pick_user, rng, order_ids):
+    order_id = rng.randint(*order_ids)
+    cursor.execute("SELECT status FROM orders WHERE id = %s FOR UPDATE", (order_id,))
+    cursor.fetchall()
+    cursor.execute("UPDATE orders SET status = %s WHERE id = %s", (rng.choice(ORDER_STATUSES), order_id))
+
+TRANSACTIONS = {
+    "Branje": point_read,
+    "Prenos stanja": transfer,
+    "Novo naročilo": new_order,
+    "Sprememba statusa": change_status,
+}
+
+def _mix(write_ratio, order_ids):
+    """Uteži transakcij za dani delež pisanj; brez naročil se spremembe statusa izpustijo"""
+    writes = {name: weight for name, weight in WRITE_WEIGHTS.items()
+              if order_ids or name != "Sprememba statusa"}
+    total = sum(writes.values())
+    weights = {"Branje": 1 - write_ratio}
+    weights.update({name: write_ratio * weight / total for name, weight in writes.items()})
+    return weights
+
+def _client(engine, level, weights, user_ids, order_ids, seed, barrier, duration, results):
+    """En klient: izvaja tehtano mešanico transakcij in ponavlja tiste, ki jih baza prekine
+
+    Latenca transakcije vključuje vse ponovitve, kot jo vidi aplikacija.
+    """
+    rng = random.Random(seed)
+    pick_user = make_param({"type": "zipfian", "min": user_ids[0], "max": user_ids[1], "s": HOT_KEY_SKEW,
+                            "scramble": True}, rng)
+    names = list(weights)
+    histograms = {name: LatencyHistogram() for name in names}
+    counts = {kind: 0 for kind in ERROR_KINDS + ["retries", "failed"]}
+    try:
+        # Stopnja izolacije velja za sejo; bazen jo ob vračilu povezave ponastavi
+        with engine.connection() as conn:
+            engine.set_isolation(conn, level)
+            cursor = conn.cursor()
+            try:
+                barrier.wait()
+                deadline = now_ns() + int(duration * 1e9)
+                while now_ns() < deadline:
+                    name = rng.choices(names, weights=[weights[n] for n in names])[0]
+                    start = now_ns()
+                    for attempt in range(MAX_RETRIES + 1):
+                        try:
+                            TRANSACTIONS[name](cursor, pick_user, rng, order_ids)
+                            conn.commit()
+                            histograms[name].record(now_ns() - start)
+                            break
+                        except Exception as e:
+                            conn.rollback()
+                            kind = engine.error_kind(e)
+                            if kind is None:
+                                counts["failed"] += 1
+                                break
+                            counts[kind] += 1
+                            if attempt == MAX_RETRIES:
+                                counts["failed"] += 1
+                            else:
+                                counts["retries"] += 1
+            finally:
+                cursor.close()
+    except threading.BrokenBarrierError:
+        return
+    except Exception:
+        # Ostali klienti in run_oltp ne smejo čakati na klienta, ki se ni povezal
+        barrier.abort()
+        raise
+    results.append((histograms, counts))
+
+def run_oltp(engine, conn, level, write_ratio=WRITE_RATIO, clients=CLIENTS, duration=DURATION, seed=SEED):
+    """Izvaja mešanico transakcij iz več klientov pri dani stopnji izolacije
+
+    Vrne TPS, histogram latenc po vrstah transakcij (v ns) ter število
+    zastojev, napak serializacije, izteklih čakanj na zaklep, ponovitev in
+    neuspešnih transakcij. Naročila, vstavljena med preizkusom, se na koncu
+    izbrišejo; spremembe stanj in statusov ostanejo.
+    """
+    cursor = conn.cursor()
+    # Id-ji se ne začnejo nujno pri 1 (npr. po ponovnem nalaganju brez ponastavitve števca)
+    cursor.execute("SELECT MIN(id), MAX(id) FROM users")
+    user_ids = cursor.fetchone()
+    cursor.execute("SELECT MIN(id), MAX(id) FROM orders")
+    min_order_id, max_order_id = cursor.fetchone()
+    conn.commit()
+    order_ids = (min_order_id, max_order_id) if max_order_id else None
+
+    weights = _mix(write_ratio, order_ids)
+    results = []
+    # Klienti in glavna nit se srečajo na pregradi, ko so vse povezave vzpostavljene
+    barrier = threading.Barrier(clients + 1)
+    threads = [
+        threading.Thread(target=_client, args=(engine, level, weights, user_ids, order_ids,
+                                               f"{seed}/{i}", barrier, duration, results))
+        for i in range(clients)
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        barrier.wait()
+    except threading.BrokenBarrierError:
+        for thread in threads:
+            thread.join()
+        raise RuntimeError("vsi klienti se niso mogli povezati")
+    start = now_ns()
+    for thread in threads:
+        thread.join()
+    elapsed = (now_ns() - start) / 1e9
+
+    cursor.execute(f"DELETE FROM orders WHERE id > {max_order_id or 0}")
+    conn.commit()
+    cursor.close()
+
+    histograms = {name: LatencyHistogram() for name in weights}
+    counts = {kind: 0 for kind in ERROR_KINDS + ["retries", "failed"]}
+    for client_histograms, client_counts in results:
+        for name, histogram in client_histograms.items():
+            histograms[name].merge(histogram)
+        for kind, count in client_counts.items():
+            counts[kind] += count
+    total = LatencyHistogram()
+    for histogram in histograms.values():
+        total.merge(histogram)
+    return {
+        "level": level,
+        "write_ratio": write_ratio,
+        "clients": clients,
+        "tps": total.total / elapsed,
+        "total": total,
+        "transactions": histograms,
+        "errors": counts,
+    }
+
+def print_oltp(name, result, width=12):
+    """Izpiše TPS, percentile in napake; nato percentile po vrstah transakcij"""
+    total, errors = result["total"], result["errors"]
+    print(f"{name:{width}} | {result['level']:16} | Pisanja: {result['write_ratio']*100:3.0f}% | "
+          f"TPS: {result['tps']:8.1f} | p50: {total.percentile(50)/1e6:7.2f}ms | "
+          f"p99: {total.percentile(99)/1e6:7.2f}ms | Zastoji: {errors['deadlock']} | "
+          f"Serializacija: {errors['serialization']} | Čakanje: {errors['lock_timeout']} | "
+          f"Ponovitve: {errors['retries']} | Neuspešne: {errors['failed']}")
+    for tx_name, histogram in result["transactions"].items():
+        if not histogram.total:
+            continue
+        print(f"{'':{width}} | {tx_name:18} | n={histogram.total:7} | "
+              f"p50: {histogram.percentile(50)/1e6:7.2f}ms | p95: {histogram.percentile(95)/1e6:7.2f}ms | "
+              f"p99: {histogram.percentile(99)/1e6:7.2f}ms")
@@ -0,0 +1,141 @@
+import random
+import threading
+import time
+from latency import LatencyHistogram, now_ns
+
+# Število klientov, ki med gradnjo indeksa berejo in pišejo
+BACKGROUND_CLIENTS = 4
+
+# Delež pisanj v ozadnji obremenitvi
+WRITE_RATIO = 0.2
+
+# Trajanje merjenja obremenitve pred gradnjo (sekunde)
+BASELINE = 3.0
+
+READ_SQL = "SELECT * FROM users WHERE id = %s"
+WRITE_SQL = "UPDATE users SET balance = %s WHERE id = %s"
+
+PHASES = ["pred", "med"]
+
+def _background_client(connection, max_id, seed, barrier, current, stop, histograms, errors):
+    """Klient ozadnje obremenitve: naključna branja in pisanja po primarnem ključu
+
+    Latence se beležijo v histogram trenutne faze (pred gradnjo ali med njo).
+    """
+    rng = random.Random(seed)
+    mine = {phase: LatencyHistogram() for phase in PHASES}
+    failed = {phase: 0 for phase in PHASES}
+    try:
+        with connection() as conn:
+            barrier.wait()
+            cursor = conn.cursor()
+            try:
+                while not stop.is_set():
+                    phase = current["phase"]
+                    user_id = rng.randint(1, max_id)
+                    start = now_ns()
+                    try:
+                        if rng.random() < WRITE_RATIO:
+                            cursor.execute(WRITE_SQL, (round(rng.uniform(0, 10000), 2), user_id))
+                        else:
+                            cursor.execute(READ_SQL, (user_id,))
+                            cursor.fetchall()
+                        conn.commit()
+                        mine[phase].record(now_ns() - start)
+                    except Exception:
+                        conn.rollback()
+                        failed[phase] += 1
+            finally:
+                cursor.close()
+    except threading.BrokenBarrierError:
+        return
+    except Exception:
+        # Ostali klienti in build_under_load ne smejo čakati na klienta, ki se ni povezal
+        barrier.abort()
+        raise
+    histograms.append(mine)
+    errors.append(failed)
+
+def build_under_load(engine, conn, index_sql, mode, clients=BACKGROUND_CLIENTS, baseline=BASELINE):
+    """Zgradi indeks v načinu mode, medtem ko teče ozadnja obremenitev
+
+    Vrne čas gradnje ter QPS, percentile in napake ozadnje obremenitve
+    pred gradnjo in med njo.
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT MAX(id) FROM users")
+    max_id = cursor.fetchone()[0]
+    cursor.close()
+    conn.commit()
+
+    current = {"phase": "pred"}
+    stop = threading.Event()
+    histograms = []
+    errors = []
+    # Merjenje pred gradnjo začne, ko so vsi klienti povezani
+    barrier = threading.Barrier(clients + 1)
+    threads = [
+        threading.Thread(target=_background_client,
+                         args=(engine.connection, max_id, i, barrier, current, stop, histograms, errors))
+        for i in range(clients)
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        barrier.wait()
+    except threading.BrokenBarrierError:
+        for thread in threads:
+            thread.join()
+        raise RuntimeError("vsi klienti se niso mogli povezati")
+
+    try:
+        start = time.perf_counter()
+        time.sleep(baseline)
+        current["phase"] = "med"
+        before = time.perf_counter() - start
+        start = time.perf_counter()
+        engine.create_index(conn, index_sql, mode)
+        build = time.perf_counter() - start
+    finally:
+        # Brez tega bi ob napaki gradnje klienti ozadnje obremenitve tekli v nedogled
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    result = {"mode": mode, "build": build}
+    for phase, elapsed in [("pred", before), ("med", build)]:
+        merged = LatencyHistogram()
+        for histogram in histograms:
+            merged.merge(histogram[phase])
+        result[phase] = {
+            "qps": merged.total / elapsed,
+            "p50": merged.percentile(50),
+            "p99": merged.percentile(99),
+            "max": merged.max,
+            "errors": sum(e[phase] for e in errors),
+        }
+    return result
+
+def compare_build_modes(engine, conn, indexes, modes, clients=BACKGROUND_CLIENTS):
+    """Vsak indeks zgradi v vseh načinih; na koncu ostane indeks iz zadnjega načina"""
+    results = {}
+    for idx_name, idx_sql in indexes:
+        results[idx_name] = []
+        for mode in modes:
+            if idx_name in engine.indexes(conn):
+                engine.drop_index(conn, idx_name)
+            results[idx_name].append(build_under_load(engine, conn, idx_sql, mode, clients))
+    return results
+
+def print_build_results(name, results):
+    """Izpiše čas gradnje in vpliv na ozadnjo obremenitev"""
+    print(f"\n{name}:")
+    print(f"{'Indeks':20} | {'Način':8} | {'Gradnja':>8} | {'QPS pred':>9} | {'QPS med':>9} | "
+          f"{'p99 pred':>9} | {'p99 med':>9} | {'Max med':>9} | Napake")
+    print("-" * 110)
+    for idx_name, modes in results.items():
+        for r in modes:
+            before, during = r["pred"], r["med"]
+            print(f"{idx_name:20} | {r['mode']:8} | {r['build']:7.3f}s | {before['qps']:9.1f} | {during['qps']:9.1f} | "
+                  f"{before['p99']/1e6:7.2f}ms | {during['p99']/1e6:7.2f}ms | {during['max']/1e6:7.2f}ms | "
+                  f"{during['errors']}")
@@ -0,0 +1,128 @@
+import time
+import numpy as np
+from datagen import ORDER_SKEW, ORDERS_PER_USER, generate_orders_numpy
+from loaders import ORDER_COLUMNS
+from plans import capture_plan
+from sampling import format_result, run_query, sample
+
+ORDER_INDEXES = [
+    ("idx_orders_user_date", "CREATE INDEX idx_orders_user_date ON orders(user_id, order_date)"),
+    ("idx_orders_status", "CREATE INDEX idx_orders_status ON orders(status)"),
+]
+
+ORDER_QUERIES = {
+    "Top kupci": """
+        SELECT u.id, u.username, SUM(o.total_amount) AS spent
+        FROM users u JOIN orders o ON o.user_id = u.id
+        GROUP BY u.id, u.username ORDER BY spent DESC LIMIT 10
+    """,
+    "Prihodek po statusu": """
+        SELECT o.status, COUNT(*), SUM(o.total_amount)
+        FROM orders o JOIN users u ON u.id = o.user_id
+        WHERE u.status = 'active' GROUP BY o.status
+    """,
+    "Zgodovina naročil": """
+        SELECT u.username, o.order_date, o.total_amount, o.status
+        FROM users u JOIN orders o ON o.user_id = u.id
+        WHERE u.id = 5000 ORDER BY o.order_date DESC LIMIT 20
+    """,
+    "Brez naročil": """
+        SELECT COUNT(*) FROM users u
+        WHERE NOT EXISTS (SELECT 1 FROM orders o WHERE o.user_id = u.id)
+    """,
+}
+
+# Stanja tabele orders: oznaka, tuji ključ, indeksi
+STATES = [
+    ("brez FK", False, []),
+    ("FK", True, []),
+    ("FK + indeksi", True, ORDER_INDEXES),
+]
+
+def fetch_user_ids(conn):
+    """Urejeni id-ji obstoječih uporabnikov; po brisanju so lahko med njimi vrzeli"""
+    cursor = conn.cursor()
+    cursor.execute("SELECT id FROM users ORDER BY id")
+    user_ids = np.array([row[0] for row in cursor.fetchall()], dtype=np.int64)
+    cursor.close()
+    conn.commit()
+    if not len(user_ids):
+        raise ValueError("Tabela users je prazna, najprej zaženi setup")
+    return user_ids
+
+def load_orders(engine, conn, num_orders, user_ids, skew=ORDER_SKEW):
+    """Izprazni orders in naloži nova naročila s privzeto metodo cilja; vrne čas v sekundah"""
+    cursor = conn.cursor()
+    cursor.execute(engine.truncate_orders_sql)
+    conn.commit()
+    cursor.close()
+    # Uteži uporabnikov se izračunajo pred merjenjem, pakete pa generira nalaganje sproti
+    batches = generate_orders_numpy(num_orders, user_ids, skew)
+    start = time.perf_counter()
+    engine.load(conn, batches, table="orders", columns=ORDER_COLUMNS)
+    return time.perf_counter() - start
+
+def set_state(engine, conn, foreign_key, indexes):
+    """Nastavi tuji ključ in indekse na orders; vrne čas dodajanja tujega ključa ali None"""
+    wanted = {idx_name for idx_name, _ in indexes}
+    for idx_name, _ in ORDER_INDEXES:
+        if idx_name not in wanted and idx_name in engine.indexes(conn, "orders"):
+            engine.drop_index(conn, idx_name, "orders")
+    added = None
+    if foreign_key and not engine.has_foreign_key(conn):
+        start = time.perf_counter()
+        engine.set_foreign_key(conn, True)
+        added = time.perf_counter() - start
+    elif not foreign_key:
+        engine.set_foreign_key(conn, False)
+    existing = engine.indexes(conn, "orders")
+    for idx_name, idx_sql in indexes:
+        if idx_name not in existing:
+            engine.create_index(conn, idx_sql)
+    return added
+
+def benchmark_orders(engine, conn, orders_per_user=ORDERS_PER_USER, skew=ORDER_SKEW,
+                     queries=ORDER_QUERIES, states=STATES):
+    """Izmeri nalaganje naročil in poizvedbe JOIN v vseh stanjih tabele orders
+
+    V vsakem stanju se naročila naložijo znova, zato čas nalaganja vključuje
+    preverjanje tujega ključa in vzdrževanje indeksov. Dodajanje tujega ključa
+    na napolnjeno tabelo (preverjanje obstoječih vrstic) se meri posebej.
+    InnoDB za tuji ključ sam ustvari indeks na orders.user_id, če ga še ni;
+    stanja, v katerih ta indeks obstaja, so zabeležena v implicit_index.
+    Tabela ostane v zadnjem stanju.
+    """
+    user_ids = fetch_user_ids(conn)
+    num_orders = len(user_ids) * orders_per_user
+    result = {"orders": num_orders, "loads": {}, "foreign_key": None, "implicit_index": [],
+              "queries": {name: {} for name in queries}}
+    for label, foreign_key, indexes in states:
+        added = set_state(engine, conn, foreign_key, indexes)
+        if added is not None:
+            result["foreign_key"] = added
+        if engine.foreign_key in engine.indexes(conn, "orders"):
+            result["implicit_index"].append(label)
+        result["loads"][label] = load_orders(engine, conn, num_orders, user_ids, skew)
+        engine.analyze(conn, "orders")
+        for query_name, query in queries.items():
+            measured = sample(lambda: run_query(conn, query))
+            measured["plan"] = capture_plan(engine, conn, query)
+            result["queries"][query_name][label] = measured
+    return result
+
+def print_orders(name, result, width=14):
+    """Izpiše čase nalaganja in poizvedb po stanjih"""
+    print(f"\n{name} - nalaganje {result['orders']} naročil:")
+    for label, elapsed in result["loads"].items():
+        implicit = " | + samodejni indeks tujega ključa" if label in result["implicit_index"] else ""
+        print(f"  {label:{width}} | {elapsed:7.2f}s | {result['orders'] / elapsed:9.0f} records/s{implicit}")
+    if result["foreign_key"] is not None:
+        print(f"  Dodajanje FK na napolnjeno tabelo: {result['foreign_key']:.3f}s")
+    if result["implicit_index"]:
+        print("  Opomba: baza je za tuji ključ sama ustvarila indeks na orders.user_id, zato stanje »FK« "
+              "ni brez indeksa in ni neposredno primerljivo z »FK + indeksi«")
+    for query_name, by_state in result["queries"].items():
+        print(f"\n{name} - {query_name}:")
+        for label, measured in by_state.items():
+            print(format_result(f"  {label}", measured, width + 2))
+            print(f"  {'':{width}} | Plan: {measured['plan']['shape']}")
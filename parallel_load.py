@@ -0,0 +1,147 @@
+import argparse
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datagen import SEED, chunk_bounds, generate_chunk_numpy
+
+NUM_RECORDS = 1000000
+
+# Število vzporednih povezav za pisanje
+WORKER_COUNTS = [1, 2, 4, 8]
+
+# Število procesov za generiranje podatkov
+GENERATOR_PROCESSES = 2
+
+# Največje število paketov v vrsti med generatorjem in pisalci
+QUEUE_SIZE = 16
+
+def _produce(num_records, processes, batch_queue):
+    """Generira pakete v procesih in jih v vrstnem redu daje v vrsto"""
+    with ProcessPoolExecutor(processes) as pool:
+        pending = deque()
+        for start, stop in chunk_bounds(num_records):
+            pending.append(pool.submit(generate_chunk_numpy, start, stop, SEED))
+            # Omejimo število paketov v obdelavi, da poraba pomnilnika ostane omejena
+            if len(pending) >= QUEUE_SIZE:
+                batch_queue.put(pending.popleft().result())
+        while pending:
+            batch_queue.put(pending.popleft().result())
+
+def _write(engine, method, batch_queue, stats, alive, options):
+    """Pisalec: jemlje pakete iz vrste in jih vstavlja prek svoje povezave
+
+    Pisalec, ki se ne more povezati ali naleti na napako, preneha jemati
+    pakete in jih prepusti ostalim; šele zadnji preživeli pisalec vrsto
+    izprazni, da generator ne obstane. Vrstice iz izpraznjenih paketov niso
+    naložene, nepotrjena transakcija se ob zaprtju povezave prekliče.
+    """
+    conn = None
+    rows = 0
+    busy = 0.0
+    error = None
+    try:
+        conn = engine.connect()
+        while True:
+            batch = batch_queue.get()
+            if batch is None:
+                break
+            start = time.perf_counter()
+            rows += engine.load(conn, [batch], method, **options)
+            busy += time.perf_counter() - start
+    except Exception as e:
+        error = e
+        print(f"  ✗ pisalec: {e}")
+        with alive["lock"]:
+            alive["count"] -= 1
+            last = alive["count"] == 0
+        if last:
+            while batch_queue.get() is not None:
+                pass
+    finally:
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
+    stats.append({"rows": rows, "busy": busy, "error": error})
+
+def parallel_load(engine, num_records, method=None, workers=1, processes=GENERATOR_PROCESSES, **options):
+    """Naloži podatke prek več povezav hkrati
+
+    Procesi generirajo pakete, niti pa jih vsaka prek svoje povezave
+    vstavljajo v bazo. Vrne skupni čas, število dejansko naloženih vrstic in
+    statistiko po pisalcih; records/s se računa iz naloženih vrstic.
+    """
+    method = method or engine.default_load_method
+    # Pisalci, ki odnehajo, ne poberejo svojega konca vrste; prostor zanj je rezerviran
+    batch_queue = queue.Queue(maxsize=QUEUE_SIZE + workers)
+    stats = []
+    alive = {"count": workers, "lock": threading.Lock()}
+    writers = [
+        threading.Thread(target=_write, args=(engine, method, batch_queue, stats, alive, options))
+        for _ in range(workers)
+    ]
+    start_time = time.perf_counter()
+    for writer in writers:
+        writer.start()
+    try:
+        _produce(num_records, processes, batch_queue)
+    finally:
+        # Oznake konca pošljemo tudi, ko generiranje spodleti, sicer pisalci čakajo v nedogled
+        for _ in range(workers):
+            batch_queue.put(None)
+        for writer in writers:
+            writer.join()
+    elapsed = time.perf_counter() - start_time
+
+    rows = sum(s["rows"] for s in stats)
+    print(f"{'✓' if rows == num_records else '✗'} {engine.name} INSERT ({method}, {workers} pisalcev): "
+          f"{elapsed:.2f}s ({rows/elapsed:.0f} records/s)")
+    if rows != num_records:
+        print(f"    naloženih le {rows} od {num_records} vrstic")
+    for i, s in enumerate(stats):
+        status = f" | napaka: {s['error']}" if s["error"] else ""
+        print(f"    pisalec {i + 1}: {s['rows']} vrstic, {s['rows']/s['busy'] if s['busy'] else 0:.0f} records/s{status}")
+    return elapsed, rows, stats
+
+def sweep_workers(engine, method=None, worker_counts=WORKER_COUNTS, num_records=NUM_RECORDS, **options):
+    """Izmeri nalaganje pri različnem številu vzporednih pisalcev; vrne {pisalci: (čas, vrstice)}"""
+    conn = engine.connect()
+    results = {}
+    for workers in worker_counts:
+        engine.truncate(conn)
+        elapsed, rows, _ = parallel_load(engine, num_records, method, workers, **options)
+        results[workers] = (elapsed, rows)
+    conn.close()
+    return results
+
+def print_scaling(results, num_records=NUM_RECORDS):
+    """Izpiše skaliranje glede na število pisalcev; nepopolna nalaganja so označena"""
+    base = min(results)
+    base_rate = results[base][1] / results[base][0]
+    print(f"{'Pisalci':8} | {'Čas':>8} | {'Records/s':>10} | Pospešitev")
+    print("-" * 50)
+    for workers, (elapsed, rows) in results.items():
+        partial = f" | naloženih le {rows} od {num_records}" if rows != num_records else ""
+        print(f"{workers:8} | {elapsed:7.2f}s | {rows/elapsed:10.0f} | {rows / elapsed / base_rate:.2f}x{partial}")
+
+if __name__ == "__main__":
+    from bench import TARGETS
+
+    parser = argparse.ArgumentParser(description="Vzporedno nalaganje prek več povezav")
+    parser.add_argument("--only", action="append", help="omeji izvajanje na cilj s tem imenom (lahko večkrat)")
+    parser.add_argument("--records", type=int, default=NUM_RECORDS, help="število zapisov")
+    parser.add_argument("--workers", type=int, nargs="+", default=WORKER_COUNTS, help="števila pisalcev")
+    args = parser.parse_args()
+    targets = [engine for engine in TARGETS if not args.only or engine.name in args.only]
+
+    print("="*60)
+    print(f"VZPOREDNO NALAGANJE - {args.records} zapisov")
+    print("="*60)
+    for engine in targets:
+        print(f"\n{engine.name}:")
+        results = sweep_workers(engine, worker_counts=args.workers, num_records=args.records)
+        print()
+        print_scaling(results, args.records)
@@ -0,0 +1,103 @@
+import statistics
+from latency import now_ns
+
+# Število merjenih ponovitev za razčlenitev faz
+ITERATIONS = 20
+
+# Število ogrevalnih ponovitev
+WARMUP = 3
+
+# Velikost paketa pri pretočnem branju (fetchmany)
+FETCH_SIZE = 1000
+
+PHASES = ["execute", "first_row", "fetch", "total"]
+
+def pg_modes(conn, fetch_size=FETCH_SIZE):
+    """Načini branja za PostgreSQL: (tovarna kurzorja, velikost paketa)
+
+    client: execute() prenese celoten rezultat v libpq, fetchall() ga le dekodira.
+    server: imenovani kurzor na strežniku, vrstice se prenašajo v paketih.
+    """
+    def server_cursor():
+        cursor = conn.cursor(name="bench_stream")
+        cursor.itersize = fetch_size
+        return cursor
+    return {
+        "client": (conn.cursor, None),
+        "server": (server_cursor, fetch_size),
+    }
+
+def mysql_modes(conn, fetch_size=FETCH_SIZE):
+    """Načini branja za MySQL/MariaDB: (tovarna kurzorja, velikost paketa)
+
+    buffered: celoten rezultat se prebere ob execute().
+    unbuffered: vrstice se berejo s strežnika sproti v paketih.
+    raw: kot buffered, a brez pretvorbe v Python tipe (za oceno dekodiranja).
+    """
+    return {
+        "buffered": (lambda: conn.cursor(buffered=True), None),
+        "unbuffered": (lambda: conn.cursor(buffered=False), fetch_size),
+        "raw": (lambda: conn.cursor(buffered=True, raw=True), None),
+    }
+
+def profile_query(conn, make_cursor, query, fetch_size=None):
+    """Izmeri faze ene izvedbe poizvedbe v nanosekundah
+
+    execute: pošiljanje in izvedba, first_row: čas do prve vrstice,
+    fetch: branje vseh vrstic po execute(), total: celoten čas.
+    """
+    cursor = make_cursor()
+    start = now_ns()
+    cursor.execute(query)
+    executed = now_ns()
+    first = cursor.fetchmany(1)
+    first_row = now_ns()
+    rows = len(first)
+    if fetch_size:
+        while True:
+            batch = cursor.fetchmany(fetch_size)
+            if not batch:
+                break
+            rows += len(batch)
+    else:
+        rows += len(cursor.fetchall())
+    done = now_ns()
+    cursor.close()
+    # Zaključimo transakcijo, sicer imenovani kurzor ostane odprt
+    conn.commit()
+    return {
+        "execute": executed - start,
+        "first_row": first_row - start,
+        "fetch": done - executed,
+        "total": done - start,
+        "rows": rows,
+    }
+
+def profile_modes(conn, modes, query, iterations=ITERATIONS, warmup=WARMUP):
+    """Vrne povprečne čase faz (ns) za vsak način branja"""
+    results = {}
+    for mode, (make_cursor, fetch_size) in modes.items():
+        for _ in range(warmup):
+            profile_query(conn, make_cursor, query, fetch_size)
+        samples = [profile_query(conn, make_cursor, query, fetch_size) for _ in range(iterations)]
+        results[mode] = {phase: statistics.mean(s[phase] for s in samples) for phase in PHASES}
+        results[mode]["rows"] = samples[-1]["rows"]
+    return results
+
+def print_phases(name, results):
+    """Izpiše razčlenitev faz po načinih branja"""
+    for mode, r in results.items():
+        print(f"{name:12} | {mode:10} | Execute: {r['execute']/1e6:7.3f}ms | "
+              f"Prva vrstica: {r['first_row']/1e6:7.3f}ms | Branje: {r['fetch']/1e6:7.3f}ms | "
+              f"Skupaj: {r['total']/1e6:7.3f}ms | Vrstic: {r['rows']}")
+
+def decode_time(results):
+    """Oceni čas dekodiranja vrstic v Python objekte (ns)
+
+    Pri PostgreSQL je rezultat po execute() že v pomnilniku odjemalca, zato je
+    branje pri client kurzorju samo dekodiranje. Pri MySQL/MariaDB je to
+    razlika med običajnim in raw kurzorjem.
+    """
+    if "client" in results:
+        return results["client"]["fetch"]
+    return max(results["buffered"]["total"] - results["raw"]["total"], 0)
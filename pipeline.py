@@ -0,0 +1,53 @@
+from latency import LatencyHistogram
+from sampling import run_query, sample
+
+# Število poizvedb, ki se pošljejo v enem krogu do strežnika
+QUERY_DEPTH = 10
+
+# Najcenejša poizvedba; njen čas je skoraj v celoti krog do strežnika
+RTT_QUERY = "SELECT 1"
+
+def measure_rtt(conn):
+    """Povprečni čas kroga do strežnika v nanosekundah (SELECT 1)"""
+    return sample(lambda: run_query(conn, RTT_QUERY))["mean"]
+
+def _per_query(result, depth):
+    """Preračuna rezultat vzorčenja depth poizvedb na eno poizvedbo"""
+    samples = [s // depth for s in result["samples"]]
+    histogram = LatencyHistogram()
+    for value in samples:
+        histogram.record(value)
+    return {
+        "mean": result["mean"] / depth,
+        "ci": result["ci"] / depth,
+        "iterations": result["iterations"],
+        "outliers": result["outliers"],
+        "samples": samples,
+        "histogram": histogram,
+    }
+
+def compare_pipeline(engine, conn, query, depth=QUERY_DEPTH):
+    """Izmeri depth izvedb poizvedbe zaporedno in v enem paketu
+
+    Zaporedno izvajanje potrebuje krog do strežnika za vsako poizvedbo,
+    paket pa enega za vse. Oba načina gresta skozi engine.execute_batch, zato
+    je delo odjemalca enako in razlika pokaže ceno omrežja. Vrne rezultate
+    na eno poizvedbo in število krogov na poizvedbo.
+    """
+    statements = [query] * depth
+    sequential = sample(lambda: [engine.execute_batch(conn, [query]) for _ in range(depth)])
+    pipelined = sample(lambda: engine.execute_batch(conn, statements))
+    conn.commit()
+    return {
+        "sequential": _per_query(sequential, depth),
+        "pipeline": _per_query(pipelined, depth),
+        "round_trips": {"sequential": 1.0, "pipeline": 1 / depth},
+    }
+
+def print_pipeline(name, result, rtt, width=12):
+    """Izpiše čas na poizvedbo v obeh načinih in prihranek v enotah kroga"""
+    sequential, pipelined = result["sequential"]["mean"], result["pipeline"]["mean"]
+    saved = sequential - pipelined
+    print(f"{name:{width}} | Zaporedno: {sequential/1e6:7.3f}ms | Paket: {pipelined/1e6:7.3f}ms | "
+          f"Krogi/poizvedbo: {result['round_trips']['sequential']:.0f} -> {result['round_trips']['pipeline']:.2f} | "
+          f"Prihranek: {saved/1e6:+.3f}ms ({saved / sequential * 100:.0f}%, {saved / rtt:.2f} RTT)")
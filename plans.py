@@ -0,0 +1,68 @@
+import hashlib
+import json
+
+# Ključi plana, ki se spreminjajo med izvedbami istega plana (ocene, časi, poraba pomnilnika)
+VOLATILE_PLAN_KEYS = {
+    "Sort Method", "Sort Space Type", "Sort Space Used", "Peak Memory Usage", "Planning", "Triggers", "JIT",
+    "cost_info", "filtered", "rows_examined_per_scan", "rows_produced_per_join", "data_read_per_join",
+}
+
+def normalize_plan(plan):
+    """Ohrani le obliko plana: vrste vozlišč, tabele, indekse, pogoje in ključe
+
+    Številske vrednosti (ocene stroškov, število vrstic, časi, bloki) in
+    ključi iz VOLATILE_PLAN_KEYS se odstranijo, zato ima isti plan ob vsakem
+    zagonu enak odtis.
+    """
+    if isinstance(plan, dict):
+        return {
+            key: normalize_plan(value) for key, value in plan.items()
+            if key not in VOLATILE_PLAN_KEYS and (isinstance(value, bool) or not isinstance(value, (int, float)))
+        }
+    if isinstance(plan, list):
+        return [normalize_plan(item) for item in plan]
+    return plan
+
+def plan_fingerprint(plan):
+    """Kratek odtis normaliziranega plana"""
+    encoded = json.dumps(normalize_plan(plan), sort_keys=True).encode()
+    return hashlib.sha256(encoded).hexdigest()[:12]
+
+def capture_plan(engine, conn, query):
+    """Zajame plan poizvedbe z odtisom in kratkim opisom oblike"""
+    summary = engine.explain(conn, query)
+    return {"fingerprint": plan_fingerprint(summary["plan"]), "shape": summary["shape"], "plan": summary["plan"]}
+
+def find_plan_changes(db, result_ids):
+    """Poišče rezultate, katerih plan se razlikuje od zadnjega prejšnjega plana
+
+    Primerja z zadnjim shranjenim planom iste poizvedbe na istem cilju
+    (iz prejšnjih zagonov ali prej v istem zagonu, npr. pred optimize).
+    """
+    changes = []
+    for result_id in result_ids:
+        current = db.execute("""
+            SELECT s.engine, x.kind, x.name, p.fingerprint, p.shape
+            FROM plans p JOIN results x ON x.id = p.result_id JOIN snapshots s ON s.id = x.snapshot_id
+            WHERE p.result_id = ?
+        """, (result_id,)).fetchone()
+        if current is None:
+            continue
+        engine, kind, name, fingerprint, shape = current
+        previous = db.execute("""
+            SELECT x.run_id, p.fingerprint, p.shape
+            FROM plans p JOIN results x ON x.id = p.result_id JOIN snapshots s ON s.id = x.snapshot_id
+            WHERE s.engine = ? AND x.kind = ? AND x.name = ? AND x.id < ?
+            ORDER BY x.id DESC LIMIT 1
+        """, (engine, kind, name, result_id)).fetchone()
+        if previous and previous[1] != fingerprint:
+            changes.append({"engine": engine, "query": name, "run": previous[0],
+                            "before": previous[2], "after": shape})
+    return changes
+
+def print_plan_changes(changes):
+    """Izpiše spremembe planov glede na prejšnje meritve"""
+    for change in changes:
+        print(f"  ! {change['engine']} | {change['query']}: plan spremenjen (primerjava z zagonom #{change['run']})")
+        print(f"      prej: {change['before']}")
+        print(f"      zdaj: {change['after']}")
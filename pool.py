@@ -0,0 +1,262 @@
+import threading
+from collections import deque
+from contextlib import contextmanager
+from latency import LatencyHistogram, now_ns
+
+# Velikosti bazena za preizkus
+POOL_SIZES = [1, 2, 4, 8, 16]
+
+# Število sočasnih klientov pri preizkusu velikosti bazena (več kot največji bazen, da nastane tekmovanje)
+POOL_CLIENTS = 32
+
+# Trajanje merjenja za posamezno velikost bazena (sekunde)
+DURATION = 10
+
+# Najdaljše čakanje na prosto povezavo (sekunde)
+POOL_TIMEOUT = 30
+
+# Število meritev vzpostavljanja povezave
+CONNECT_SAMPLES = 50
+
+class PoolTimeout(Exception):
+    """V bazenu ni bilo proste povezave v dovoljenem času"""
+
+class ConnectionPool:
+    """Nit-varen bazen največ size povezav, ustvarjenih s klicem connect
+
+    Povezave se odpirajo po potrebi; ko jih je size, acquire čaka na vrnjeno
+    povezavo največ timeout sekund. Čakajoči dobijo vrnjene povezave po
+    vrstnem redu prihoda, sicer bi jih nit, ki povezavo vrne, takoj znova
+    prevzela in ostale izstradala. Ob vračilu se odprta transakcija prekliče
+    in pokliče reset (npr. Engine.reset_session); povezava, ki pri tem vrže
+    napako, se zapre in izloči. Zadnja vrnjena povezava se prva ponovno
+    uporabi, zato ostanejo pri majhnem prometu v uporabi iste povezave.
+    Čakanje in vzpostavljanje povezav se beležita v histograma (v ns).
+    """
+
+    def __init__(self, connect, size, timeout=POOL_TIMEOUT, reset=None):
+        self.connect = connect
+        self.size = size
+        self.timeout = timeout
+        self.reset = reset
+        self.idle = []
+        self.waiters = deque()
+        self.closed = False
+        self.opened = 0
+        self.timeouts = 0
+        self.waits = LatencyHistogram()
+        self.connects = LatencyHistogram()
+        self.condition = threading.Condition()
+
+    def fill(self):
+        """Vnaprej odpre vse povezave, da vzpostavljanje ni del merjenja"""
+        conns = [self.acquire() for _ in range(self.size)]
+        for conn in conns:
+            self.release(conn)
+        # Prevzemi ob polnjenju ne sodijo v histogram čakanja
+        self.waits = LatencyHistogram()
+
+    def acquire(self):
+        start = now_ns()
+        with self.condition:
+            if self.idle:
+                conn = self.idle.pop()
+                self.waits.record(now_ns() - start)
+                return conn
+            if self.opened >= self.size:
+                # Vrnjena povezava se vstavi v slot prvega čakajočega
+                slot = []
+                self.waiters.append(slot)
+                while not slot and self.opened >= self.size:
+                    remaining = self.timeout - (now_ns() - start) / 1e9
+                    if remaining <= 0:
+                        self.waiters.remove(slot)
+                        self.timeouts += 1
+                        raise PoolTimeout(f"ni proste povezave v {self.timeout} s (velikost bazena {self.size})")
+                    self.condition.wait(remaining)
+                if slot:
+                    self.waits.record(now_ns() - start)
+                    return slot[0]
+                # Izločena povezava je sprostila mesto za novo
+                self.waiters.remove(slot)
+            # Mesto rezerviramo takoj, povezavo pa odpremo zunaj zaklepa
+            self.opened += 1
+        try:
+            connect_start = now_ns()
+            conn = self.connect()
+        except Exception:
+            with self.condition:
+                self.opened -= 1
+                self.condition.notify_all()
+            raise
+        end = now_ns()
+        with self.condition:
+            self.connects.record(end - connect_start)
+            self.waits.record(end - start)
+        return conn
+
+    def release(self, conn):
+        try:
+            conn.rollback()
+            if self.reset:
+                self.reset(conn)
+        except Exception:
+            self._discard(conn)
+            return
+        with self.condition:
+            if not self.closed:
+                if self.waiters:
+                    self.waiters.popleft().append(conn)
+                    self.condition.notify_all()
+                else:
+                    self.idle.append(conn)
+                return
+        self._discard(conn)
+
+    def _discard(self, conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+        with self.condition:
+            self.opened -= 1
+            self.condition.notify_all()
+
+    @contextmanager
+    def connection(self):
+        """Izposodi povezavo za čas bloka with"""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self):
+        """Zapre proste povezave; izposojene se zaprejo ob vračilu"""
+        with self.condition:
+            idle, self.idle = self.idle, []
+            self.closed = True
+        for conn in idle:
+            self._discard(conn)
+
+def _query(conn, query):
+    cursor = conn.cursor()
+    try:
+        cursor.execute(query)
+        cursor.fetchall()
+    finally:
+        cursor.close()
+    conn.commit()
+
+@contextmanager
+def _new_connection(connect):
+    conn = connect()
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+def connect_cost(engine, query, samples=CONNECT_SAMPLES):
+    """Izmeri poizvedbo na novi povezavi in na povezavi iz bazena
+
+    Nova povezava vključuje TCP, overitev in zaprtje. Vrne histograma (v ns).
+    """
+    fresh, pooled = LatencyHistogram(), LatencyHistogram()
+    pool = ConnectionPool(engine.connect, 1)
+    pool.fill()
+    try:
+        for _ in range(samples):
+            start = now_ns()
+            with _new_connection(engine.connect) as conn:
+                _query(conn, query)
+            fresh.record(now_ns() - start)
+            start = now_ns()
+            with pool.connection() as conn:
+                _query(conn, query)
+            pooled.record(now_ns() - start)
+    finally:
+        pool.close()
+    return {"nova": fresh, "bazen": pooled}
+
+def _client(connection, query, barrier, duration, latencies, errors):
+    """En klient: za vsako zahtevo izposodi povezavo, izvede poizvedbo in jo vrne"""
+    histogram = LatencyHistogram()
+    failed = 0
+    barrier.wait()
+    deadline = now_ns() + int(duration * 1e9)
+    while now_ns() < deadline:
+        start = now_ns()
+        try:
+            with connection() as conn:
+                _query(conn, query)
+            histogram.record(now_ns() - start)
+        except Exception:
+            failed += 1
+    latencies.append(histogram)
+    errors.append(failed)
+
+def run_pool(engine, query, size, clients=POOL_CLIENTS, duration=DURATION, timeout=POOL_TIMEOUT):
+    """clients klientov si deli bazen velikosti size (None: nova povezava za vsako zahtevo)
+
+    Latenca zahteve vključuje čakanje na povezavo. Bazen se pred merjenjem
+    napolni. Vrne QPS, histogram latenc in čakanja (v ns), število odprtih
+    povezav, izteklih čakanj in drugih napak.
+    """
+    pool = None
+    if size is None:
+        connection = lambda: _new_connection(engine.connect)
+    else:
+        pool = ConnectionPool(engine.connect, size, timeout)
+        pool.fill()
+        connection = pool.connection
+    latencies, errors = [], []
+    # Klienti povezave izposojajo šele med merjenjem, zato pregrada le poravna začetek niti
+    barrier = threading.Barrier(clients + 1)
+    threads = [
+        threading.Thread(target=_client, args=(connection, query, barrier, duration, latencies, errors))
+        for _ in range(clients)
+    ]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = now_ns()
+    for thread in threads:
+        thread.join()
+    elapsed = (now_ns() - start) / 1e9
+
+    total = LatencyHistogram()
+    for histogram in latencies:
+        total.merge(histogram)
+    result = {
+        "size": size,
+        "clients": clients,
+        "qps": total.total / elapsed,
+        "latency": total,
+        "wait": pool.waits if pool else None,
+        "opened": pool.connects.total if pool else total.total + sum(errors),
+        "timeouts": pool.timeouts if pool else 0,
+        "errors": sum(errors) - (pool.timeouts if pool else 0),
+    }
+    if pool:
+        pool.close()
+    return result
+
+def sweep_pool_sizes(engine, query, sizes=POOL_SIZES, clients=POOL_CLIENTS, duration=DURATION):
+    """Izmeri run_pool brez bazena in za vse velikosti bazena"""
+    return [run_pool(engine, query, size, clients, duration) for size in [None] + list(sizes)]
+
+def print_connect_cost(name, cost, width=12):
+    fresh, pooled = cost["nova"], cost["bazen"]
+    print(f"{name:{width}} | Nova povezava: p50 {fresh.percentile(50)/1e6:7.2f}ms, p99 {fresh.percentile(99)/1e6:7.2f}ms | "
+          f"Iz bazena: p50 {pooled.percentile(50)/1e6:7.2f}ms, p99 {pooled.percentile(99)/1e6:7.2f}ms | "
+          f"Razmerje: {fresh.percentile(50) / pooled.percentile(50):.1f}x")
+
+def print_pool_result(name, result, width=12):
+    """Izpiše rezultat ene velikosti bazena v eni vrstici"""
+    size = "brez" if result["size"] is None else result["size"]
+    latency, wait = result["latency"], result["wait"]
+    waits = (f"Čakanje: p50 {wait.percentile(50)/1e6:7.2f}ms, p99 {wait.percentile(99)/1e6:7.2f}ms"
+             if wait else f"{'Čakanje: -':37}")
+    print(f"{name:{width}} | Bazen: {size:>4} | QPS: {result['qps']:8.1f} | "
+          f"p50: {latency.percentile(50)/1e6:7.2f}ms | p99: {latency.percentile(99)/1e6:7.2f}ms | {waits} | "
+          f"Povezav: {result['opened']:6} | Izteklo: {result['timeouts']} | Napake: {result['errors']}")
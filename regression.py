@@ -0,0 +1,146 @@
+import argparse
+import json
+import sqlite3
+import sys
+from datetime import datetime, timezone
+from results import RESULTS_DB
+from sampling import ALPHA, mann_whitney_p
+
+# Privzeta datoteka z osnovnim zagonom
+BASELINE = "baseline.json"
+
+# Najmanjše poslabšanje povprečja (v %), ki šteje kot regresija, če je tudi statistično značilno
+THRESHOLD = 5.0
+
+def load_run(db, run_id=None):
+    """Prebere rezultate benchmarka iz zagona (privzeto zadnjega z benchmarkom)
+
+    Vrne (run_id, rezultati {poizvedba: {cilj: {mean, samples, plan}}}, stanja ciljev).
+    Če je zagon benchmark izvedel večkrat (npr. pred in po optimize), velja zadnji.
+    """
+    if run_id is None:
+        run_id = db.execute("SELECT MAX(run_id) FROM results WHERE kind = 'benchmark'").fetchone()[0]
+        if run_id is None:
+            raise ValueError("V bazi ni rezultatov benchmarka")
+    rows = db.execute("""
+        SELECT x.id, x.name, x.mean, p.fingerprint, p.shape, s.engine, s.version, s.config_hash, s.indexes, s.row_count
+        FROM results x JOIN snapshots s ON s.id = x.snapshot_id
+        LEFT JOIN plans p ON p.result_id = x.id
+        WHERE x.kind = 'benchmark' AND x.run_id = ?
+        ORDER BY x.id
+    """, (run_id,)).fetchall()
+    if not rows:
+        raise ValueError(f"Zagon #{run_id} nima rezultatov benchmarka")
+
+    results = {}
+    states = {}
+    for result_id, query, mean, fingerprint, shape, engine, version, config, indexes, row_count in rows:
+        samples = [value for (value,) in db.execute("SELECT value FROM samples WHERE result_id = ?", (result_id,))]
+        results.setdefault(query, {})[engine] = {
+            "mean": mean, "samples": samples,
+            "plan": {"fingerprint": fingerprint, "shape": shape} if fingerprint else None,
+        }
+        states[engine] = {"version": version, "config_hash": config, "indexes": indexes, "rows": row_count}
+    return run_id, results, states
+
+def save_baseline(path, run_id, results, states):
+    """Shrani osnovni zagon z vsemi vzorci v JSON datoteko"""
+    baseline = {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "run": run_id,
+        "states": states,
+        "results": {
+            query: {engine: {"mean": r["mean"], "samples": list(r["samples"]), "plan": r["plan"]}
+                    for engine, r in by_engine.items()}
+            for query, by_engine in results.items()
+        },
+    }
+    with open(path, "w") as f:
+        json.dump(baseline, f)
+
+def load_baseline(path=BASELINE):
+    with open(path) as f:
+        return json.load(f)
+
+def compare(baseline, results, threshold=THRESHOLD, alpha=ALPHA):
+    """Primerja rezultate z osnovo po poizvedbah in ciljih
+
+    Regresija je poslabšanje povprečja za več kot threshold %, ki je hkrati
+    statistično značilno (Mann-Whitney, p < alpha). Tako niti šum niti
+    majhna, a značilna razlika pri zelo ozkih porazdelitvah ne sprožita alarma.
+    Spremenjen odtis plana je označen ne glede na čas.
+    """
+    rows = []
+    for query, by_engine in results.items():
+        for engine, current in by_engine.items():
+            base = baseline["results"].get(query, {}).get(engine)
+            if base is None:
+                continue
+            diff_percent = (current["mean"] - base["mean"]) / base["mean"] * 100
+            p_value = mann_whitney_p(base["samples"], current["samples"])
+            if p_value >= alpha or abs(diff_percent) <= threshold:
+                status = "ok"
+            elif diff_percent > 0:
+                status = "regression"
+            else:
+                status = "improvement"
+            rows.append({
+                "query": query, "engine": engine, "baseline": base["mean"], "current": current["mean"],
+                "diff_percent": diff_percent, "p_value": p_value, "status": status,
+                "plan_changed": bool(base.get("plan") and current.get("plan")
+                                     and base["plan"]["fingerprint"] != current["plan"]["fingerprint"]),
+            })
+    return rows
+
+STATUS_LABELS = {"ok": "✓", "regression": "✗ POČASNEJE", "improvement": "↑ HITREJE"}
+
+def print_comparison(rows, baseline, states=None):
+    """Izpiše tabelo razlik in spremembe različic ali nastavitev glede na osnovo"""
+    print(f"\nPrimerjava z osnovo (zagon #{baseline['run']}, {baseline['created_at']}):")
+    for engine, state in (states or {}).items():
+        base_state = baseline["states"].get(engine)
+        if not base_state:
+            continue
+        for key, label in [("version", "različica"), ("config_hash", "nastavitve"), ("indexes", "indeksi")]:
+            if base_state[key] != state[key]:
+                print(f"  ! {engine}: {label} {base_state[key]} -> {state[key]}")
+
+    print(f"{'Poizvedba':18} | {'Cilj':12} | {'Osnova':>9} | {'Novo':>9} | {'Razlika':>8} | {'p':>6} | Stanje")
+    print("-" * 85)
+    for row in rows:
+        print(f"{row['query']:18} | {row['engine']:12} | {row['baseline']/1e6:7.3f}ms | {row['current']/1e6:7.3f}ms | "
+              f"{row['diff_percent']:+7.1f}% | {row['p_value']:6.4f} | {STATUS_LABELS[row['status']]}"
+              f"{' (nov plan)' if row['plan_changed'] else ''}")
+    regressions = sum(1 for row in rows if row["status"] == "regression")
+    print(f"\nRegresij: {regressions}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Shranjevanje osnove in preverjanje regresij")
+    parser.add_argument("command", choices=["baseline", "check"], help="shrani osnovo ali primerjaj zagon z njo")
+    parser.add_argument("--results", default=RESULTS_DB, help="baza SQLite z rezultati")
+    parser.add_argument("--run", type=int, help="zagon (privzeto zadnji z benchmarkom)")
+    parser.add_argument("--baseline", default=BASELINE, help="datoteka z osnovo")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="prag regresije v %%")
+    args = parser.parse_args()
+
+    db = sqlite3.connect(args.results)
+    try:
+        run_id, results, states = load_run(db, args.run)
+    except ValueError as e:
+        parser.error(str(e))
+    finally:
+        db.close()
+
+    if args.command == "baseline":
+        save_baseline(args.baseline, run_id, results, states)
+        print(f"✓ Osnova shranjena v {args.baseline} (zagon #{run_id})")
+        return
+
+    baseline = load_baseline(args.baseline)
+    rows = compare(baseline, results, args.threshold)
+    if print_comparison(rows, baseline, states):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
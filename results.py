@@ -0,0 +1,210 @@
+import getpass
+import hashlib
+import json
+import platform
+import socket
+import sqlite3
+from datetime import datetime, timezone
+from loadgen import PERCENTILES
+
+# Privzeta datoteka z rezultati vseh zagonov
+RESULTS_DB = "results.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started_at TEXT NOT NULL,
+    commands TEXT,
+    num_records INTEGER,
+    client_host TEXT,
+    client_user TEXT,
+    os TEXT,
+    kernel TEXT,
+    python TEXT
+);
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    engine TEXT NOT NULL,
+    dialect TEXT,
+    host TEXT,
+    port INTEGER,
+    version TEXT,
+    server_os TEXT,
+    config_hash TEXT,
+    indexes TEXT,
+    row_count INTEGER,
+    taken_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    snapshot_id INTEGER REFERENCES snapshots(id),
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    variant TEXT,
+    unit TEXT NOT NULL,
+    mean REAL,
+    ci REAL,
+    iterations INTEGER,
+    outliers INTEGER,
+    errors INTEGER
+);
+CREATE TABLE IF NOT EXISTS samples (
+    result_id INTEGER NOT NULL REFERENCES results(id),
+    value INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS percentiles (
+    result_id INTEGER NOT NULL REFERENCES results(id),
+    percentile REAL NOT NULL,
+    value REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS plans (
+    result_id INTEGER NOT NULL REFERENCES results(id),
+    fingerprint TEXT NOT NULL,
+    shape TEXT,
+    plan TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_results_lookup ON results(kind, name);
+CREATE INDEX IF NOT EXISTS idx_samples_result ON samples(result_id);
+CREATE INDEX IF NOT EXISTS idx_percentiles_result ON percentiles(result_id);
+CREATE INDEX IF NOT EXISTS idx_plans_result ON plans(result_id);
+"""
+
+# Stolpci, dodani obstoječim tabelam po prvi različici sheme; starejše baze jih dobijo ob odprtju
+ADDED_COLUMNS = {
+    "results": [("variant", "TEXT"), ("errors", "INTEGER")],
+}
+
+def _now():
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+def open_store(path=RESULTS_DB):
+    """Odpre (in po potrebi ustvari) bazo rezultatov"""
+    db = sqlite3.connect(path)
+    db.executescript(SCHEMA)
+    _migrate(db)
+    return db
+
+def _migrate(db):
+    """Doda stolpce, ki jih baza, ustvarjena s starejšo shemo, še nima"""
+    for table, columns in ADDED_COLUMNS.items():
+        existing = {row[1] for row in db.execute(f"PRAGMA table_info({table})")}
+        for column, column_type in columns:
+            if column not in existing:
+                db.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+    db.commit()
+
+def start_run(db, commands, num_records):
+    """Zapiše nov zagon z opisom odjemalca in vrne njegov id"""
+    uname = platform.uname()
+    cursor = db.execute(
+        "INSERT INTO runs (started_at, commands, num_records, client_host, client_user, os, kernel, python) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (_now(), " ".join(commands), num_records, socket.gethostname(), getpass.getuser(),
+         uname.system, uname.release, platform.python_version())
+    )
+    db.commit()
+    return cursor.lastrowid
+
+def config_hash(settings):
+    """Kratek prstni odtis nastavitev strežnika"""
+    encoded = json.dumps(sorted(settings.items()), default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+def describe(engine, conn):
+    """Trenutno stanje cilja: različica, OS, prstni odtis nastavitev, indeksi, število vrstic"""
+    state = engine.state(conn)
+    return {
+        "version": engine.version(conn),
+        "os": state["os"],
+        "config_hash": config_hash(state["settings"]),
+        "indexes": ",".join(state["indexes"]),
+        "rows": state["rows"],
+    }
+
+def snapshot(db, run_id, engine, conn):
+    """Zapiše trenutno stanje cilja (različica, nastavitve, indeksi, število vrstic)
+
+    Stanje se zajame ob vsakem zapisu rezultatov, ker se indeksi in
+    podatki med ukazi istega zagona spreminjajo (setup, optimize).
+    """
+    state = describe(engine, conn)
+    cursor = db.execute(
+        "INSERT INTO snapshots (run_id, engine, dialect, host, port, version, server_os, config_hash, "
+        "indexes, row_count, taken_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (run_id, engine.name, engine.dialect, engine.host, engine.port, state["version"],
+         state["os"], state["config_hash"], state["indexes"], state["rows"], _now())
+    )
+    return cursor.lastrowid
+
+def _insert_result(db, run_id, snapshot_id, kind, name, unit, mean, ci=None, iterations=None,
+                   outliers=None, samples=(), variant=None, histogram=None, errors=None, plan=None):
+    cursor = db.execute(
+        "INSERT INTO results (run_id, snapshot_id, kind, name, variant, unit, mean, ci, iterations, outliers, errors) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (run_id, snapshot_id, kind, name, variant, unit, mean, ci, iterations, outliers, errors)
+    )
+    if samples:
+        db.executemany("INSERT INTO samples (result_id, value) VALUES (?, ?)",
+                       ((cursor.lastrowid, value) for value in samples))
+    if histogram is not None and histogram.total:
+        db.executemany("INSERT INTO percentiles (result_id, percentile, value) VALUES (?, ?, ?)",
+                       ((cursor.lastrowid, p, histogram.percentile(p)) for p in PERCENTILES))
+    if plan is not None:
+        db.execute("INSERT INTO plans (result_id, fingerprint, shape, plan) VALUES (?, ?, ?, ?)",
+                   (cursor.lastrowid, plan["fingerprint"], plan["shape"], json.dumps(plan["plan"])))
+    return cursor.lastrowid
+
+def record_samples(db, run_id, targets, conns, kind, results, variant=None):
+    """Zapiše rezultate vzorčenja {poizvedba: {cilj: rezultat}} z vsemi vzorci (ns)
+
+    Če rezultat vsebuje zajeti plan (plan), se shrani skupaj z njim.
+    Vrne id-je zapisanih rezultatov.
+    """
+    snapshots = {engine.name: snapshot(db, run_id, engine, conns[engine.name]) for engine in targets}
+    result_ids = []
+    for name, by_engine in results.items():
+        for engine_name, result in by_engine.items():
+            result_ids.append(_insert_result(
+                db, run_id, snapshots[engine_name], kind, name, "ns", result["mean"],
+                result["ci"], result["iterations"], result["outliers"], result["samples"],
+                variant=variant, plan=result.get("plan")
+            ))
+    db.commit()
+    return result_ids
+
+def record_values(db, run_id, targets, conns, kind, unit, values):
+    """Zapiše posamezne meritve {cilj: {ime: vrednost}} (npr. čas nalaganja, velikost)"""
+    for engine in targets:
+        if engine.name not in values:
+            continue
+        snapshot_id = snapshot(db, run_id, engine, conns[engine.name])
+        for name, value in values[engine.name].items():
+            _insert_result(db, run_id, snapshot_id, kind, str(name), unit, value, iterations=1)
+    db.commit()
+
+def record_histograms(db, run_id, targets, conns, kind, histograms):
+    """Zapiše povzetke histogramov {cilj: {ime: histogram}} s percentili, brez posameznih vzorcev"""
+    for engine in targets:
+        snapshot_id = snapshot(db, run_id, engine, conns[engine.name])
+        for name, histogram in histograms[engine.name].items():
+            if histogram.total:
+                _insert_result(db, run_id, snapshot_id, kind, name, "ns", histogram.mean(),
+                               iterations=histogram.total, histogram=histogram)
+    db.commit()
+
+def record_load_curves(db, run_id, targets, conns, curves):
+    """Zapiše krivulje skaliranja {poizvedba: {cilj: [rezultat na število klientov]}}
+
+    Vsaka točka je en rezultat z variant = število klientov, mean = QPS in
+    percentili latence iz združenega histograma.
+    """
+    snapshots = {engine.name: snapshot(db, run_id, engine, conns[engine.name]) for engine in targets}
+    for name, by_engine in curves.items():
+        for engine_name, points in by_engine.items():
+            for point in points:
+                _insert_result(db, run_id, snapshots[engine_name], "concurrency", name, "qps", point["qps"],
+                               iterations=point["requests"], errors=point["errors"],
+                               variant=str(point["clients"]), histogram=point["histogram"])
+    db.commit()
@@ -0,0 +1,114 @@
+import math
+import statistics
+from latency import LatencyHistogram, now_ns
+
+# Število ogrevalnih izvedb, ki niso vključene v rezultat
+WARMUP = 3
+
+# Meje adaptivnega vzorčenja
+MIN_ITERATIONS = 10
+MAX_ITERATIONS = 1000
+
+# Časovni proračun za eno poizvedbo na eni bazi (sekunde)
+TIME_BUDGET = 5.0
+
+# Ciljna relativna polširina 95 % intervala zaupanja povprečja
+TARGET_CI = 0.02
+
+# Stopnja značilnosti za primerjavo baz
+ALPHA = 0.05
+
+Z_95 = 1.96
+
+def run_query(conn, query):
+    """Izvede poizvedbo in prebere vse vrstice"""
+    cursor = conn.cursor()
+    cursor.execute(query)
+    cursor.fetchall()
+    cursor.close()
+
+def ci_halfwidth(samples):
+    """Polširina 95 % intervala zaupanja povprečja"""
+    return Z_95 * statistics.stdev(samples) / math.sqrt(len(samples))
+
+def count_outliers(samples):
+    """Število izstopajočih vzorcev po Tukeyjevem pravilu (1.5 IQR)"""
+    q1, _, q3 = statistics.quantiles(samples, n=4)
+    iqr = q3 - q1
+    low, high = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+    return sum(1 for s in samples if s < low or s > high)
+
+def sample(run, warmup=WARMUP, min_iterations=MIN_ITERATIONS, max_iterations=MAX_ITERATIONS,
+           time_budget=TIME_BUDGET, target_ci=TARGET_CI):
+    """Ponavlja run(), dokler interval zaupanja ni dovolj ozek
+
+    Najprej izvede warmup ogrevalnih ponovitev (hladen predpomnilnik,
+    priprava plana), nato vzorči vsaj min_iterations in največ
+    max_iterations krat oziroma do izteka časovnega proračuna.
+    Časi so v nanosekundah.
+    """
+    for _ in range(warmup):
+        run()
+
+    histogram = LatencyHistogram()
+    samples = []
+    deadline = now_ns() + int(time_budget * 1e9)
+    while True:
+        start = now_ns()
+        run()
+        elapsed = now_ns() - start
+        histogram.record(elapsed)
+        samples.append(elapsed)
+        if len(samples) < min_iterations:
+            continue
+        if len(samples) >= max_iterations or now_ns() >= deadline:
+            break
+        if ci_halfwidth(samples) <= target_ci * statistics.mean(samples):
+            break
+
+    return {
+        "mean": statistics.mean(samples),
+        "ci": ci_halfwidth(samples),
+        "iterations": len(samples),
+        "outliers": count_outliers(samples),
+        "samples": samples,
+        "histogram": histogram,
+    }
+
+def mann_whitney_p(a, b):
+    """Dvostranska p-vrednost Mann-Whitneyjevega U testa (normalni približek)
+
+    Test ne predpostavlja normalne porazdelitve, kar ustreza latencam z
+    dolgim repom.
+    """
+    combined = sorted([(v, 0) for v in a] + [(v, 1) for v in b])
+    ranks = [0.0] * len(combined)
+    tie_term = 0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        ties = j - i + 1
+        tie_term += ties**3 - ties
+        i = j + 1
+
+    n1, n2 = len(a), len(b)
+    rank_sum = sum(r for r, (_, group) in zip(ranks, combined) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    sigma = math.sqrt(n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1))))
+    if sigma == 0:
+        return 1.0
+    z = (u - n1 * n2 / 2) / sigma
+    return math.erfc(abs(z) / math.sqrt(2))
+
+def format_result(name, result, width=12):
+    """Oblikuje vrstico z rezultatom vzorčenja"""
+    histogram = result["histogram"]
+    return (f"{name:{width}} | Avg: {result['mean']/1e6:7.3f}ms ± {result['ci']/1e6:6.3f}ms | "
+            f"p50: {histogram.percentile(50)/1e6:7.3f}ms | Min: {histogram.min/1e6:7.3f}ms | "
+            f"Max: {histogram.max/1e6:7.3f}ms | n={result['iterations']} | "
+            f"Izstopajoči: {result['outliers']}")
@@ -0,0 +1,158 @@
+import math
+import random
+import re
+import tomllib
+from latency import LatencyHistogram, now_ns
+
+# Privzeta datoteka z opisom obremenitve
+DEFAULT_WORKLOAD = "workloads/users.toml"
+
+# Seme generatorjev parametrov - vse baze dobijo enako zaporedje parametrov
+SEED = 42
+
+PARAM_PATTERN = re.compile(r"%\((\w+)\)s")
+
+def load_workload(path=DEFAULT_WORKLOAD):
+    """Prebere opis obremenitve iz TOML ali YAML datoteke"""
+    if path.endswith((".yaml", ".yml")):
+        # PyYAML je potreben le za YAML datoteke
+        import yaml
+        with open(path) as f:
+            workload = yaml.safe_load(f)
+    else:
+        with open(path, "rb") as f:
+            workload = tomllib.load(f)
+    for query in workload["queries"]:
+        query.setdefault("weight", 1)
+        query.setdefault("params", {})
+    return workload
+
+def compile_sql(sql, placeholder):
+    """Pretvori imenovane parametre %(ime)s v pozicijske
+
+    placeholder je funkcija, ki za zaporedno številko (od 1) vrne oznako,
+    npr. $1 za PostgreSQL ali %s za MySQL. Vrne SQL in vrstni red imen.
+    """
+    names = []
+
+    def replace(match):
+        names.append(match.group(1))
+        return placeholder(len(names))
+
+    return PARAM_PATTERN.sub(replace, sql), names
+
+def _zipf_cum_weights(n, s):
+    total = 0.0
+    cum_weights = []
+    for rank in range(1, n + 1):
+        total += 1 / rank**s
+        cum_weights.append(total)
+    return cum_weights
+
+def scramble_step(n):
+    """Korak permutacije i -> i * korak mod n, tuj številu n (zlati rez)"""
+    step = max(1, int(n * 0.6180339887))
+    while math.gcd(step, n) != 1:
+        step += 1
+    return step
+
+def make_param(spec, rng):
+    """Ustvari generator vrednosti parametra iz opisa
+
+    Podprte vrste: uniform, zipfian, range, like in choice. Generator
+    vrne eno vrednost ali slovar vrednosti (range vrne _low in _high).
+    """
+    kind = spec["type"]
+    if kind == "uniform":
+        return lambda: rng.randint(spec["min"], spec["max"])
+    if kind == "zipfian":
+        n = spec["max"] - spec["min"] + 1
+        cum_weights = _zipf_cum_weights(n, spec.get("s", 1.0))
+        # Brez premešanja so najpogostejši ključi najmanjši id-ji (na istih
+        # straneh tabele); scramble jih razprši po celi tabeli
+        step = scramble_step(n) if spec.get("scramble") else 1
+        ranks = range(n)
+        return lambda: spec["min"] + rng.choices(ranks, cum_weights=cum_weights)[0] * step % n
+    if kind == "range":
+        def generate():
+            low = rng.uniform(spec["min"], spec["max"] - spec["width"])
+            return {"_low": round(low, 2), "_high": round(low + spec["width"], 2)}
+        return generate
+    if kind == "like":
+        pattern = spec.get("pattern", "%{}%")
+        return lambda: pattern.format(rng.randint(spec["min"], spec["max"]))
+    if kind == "choice":
+        return lambda: rng.choice(spec["values"])
+    raise ValueError(f"Neznana vrsta parametra: {kind}")
+
+class QueryMix:
+    """Tehtana mešanica poizvedb z generatorji parametrov"""
+
+    def __init__(self, workload, seed=SEED):
+        self.rng = random.Random(seed)
+        self.queries = workload["queries"]
+        self.weights = [query["weight"] for query in self.queries]
+        self.generators = [
+            {name: make_param(spec, self.rng) for name, spec in query["params"].items()}
+            for query in self.queries
+        ]
+
+    def params(self, index):
+        """Generira vrednosti parametrov za poizvedbo z indeksom index"""
+        values = {}
+        for name, generate in self.generators[index].items():
+            value = generate()
+            if isinstance(value, dict):
+                for suffix, v in value.items():
+                    values[name + suffix] = v
+            else:
+                values[name] = value
+        return values
+
+    def next(self):
+        """Izbere naslednjo poizvedbo glede na uteži in ji generira parametre"""
+        index = self.rng.choices(range(len(self.queries)), weights=self.weights)[0]
+        return index, self.params(index)
+
+def run_workload(engine, conn, workload, duration=None, iterations=None, seed=SEED):
+    """Izvaja mešanico poizvedb na pripravljenih stavkih
+
+    Teče duration sekund (privzeto iz datoteke) ali iterations izvedb.
+    Vrne histogram latenc po poizvedbah in skupno število izvedb na sekundo.
+    """
+    duration = duration or workload.get("duration", 10)
+    mix = QueryMix(workload, seed)
+    statements = [
+        engine.prepare(conn, f"bench_q{i}", query["sql"])
+        for i, query in enumerate(workload["queries"])
+    ]
+    histograms = [LatencyHistogram() for _ in statements]
+
+    start = now_ns()
+    deadline = start + int(duration * 1e9)
+    done = 0
+    while (iterations is None and now_ns() < deadline) or (iterations is not None and done < iterations):
+        index, params = mix.next()
+        begin = now_ns()
+        statements[index].execute(params)
+        histograms[index].record(now_ns() - begin)
+        done += 1
+    elapsed = (now_ns() - start) / 1e9
+
+    for statement in statements:
+        statement.close()
+    conn.commit()
+    return {
+        "qps": done / elapsed,
+        "queries": {query["name"]: histogram for query, histogram in zip(workload["queries"], histograms)},
+    }
+
+def print_workload_result(name, result, width=12):
+    """Izpiše rezultat obremenitve po poizvedbah"""
+    print(f"{name:{width}} | Skupaj: {result['qps']:.1f} poizvedb/s")
+    for query_name, histogram in result["queries"].items():
+        if not histogram.total:
+            continue
+        print(f"{'':{width}} | {query_name:20} | n={histogram.total:6} | "
+              f"Avg: {histogram.mean()/1e6:7.3f}ms | p50: {histogram.percentile(50)/1e6:7.3f}ms | "
+              f"p95: {histogram.percentile(95)/1e6:7.3f}ms | p99: {histogram.percentile(99)/1e6:7.3f}ms")